@@ -7,13 +7,27 @@ monitoring functionality.
 import json
 import time
 from collections.abc import Callable, Iterable
-from typing import Any, Protocol
+from typing import Any, Final, Protocol
 
 import structlog
 from openc_python_common.observability import log_bind, observe_around
 
 logger = structlog.get_logger(__name__)
 
+# Static response parts, built once at import. Header lists are copied per
+# response because wsgiref appends Content-Length to the list it is given.
+_JSON_HEADERS: Final = (("Content-Type", "application/json"),)
+_TEXT_HEADERS: Final = (("Content-Type", "text/plain"),)
+_HEALTHY_BODY: Final = (json.dumps({"status": "healthy"}).encode("utf-8"),)
+_UNHEALTHY_BODY: Final = (json.dumps({"status": "unhealthy"}).encode("utf-8"),)
+_OK_BODY: Final = (b"OK",)
+_FAIL_BODY: Final = (b"FAIL",)
+_NOT_FOUND_BODY: Final = (b"Not Found",)
+_METHOD_NOT_ALLOWED_BODY: Final = (b"Method Not Allowed",)
+
+# Compact output keeps json on its C encoder; indent= forces the Python one.
+_STATUS_ENCODER: Final = json.JSONEncoder(separators=(",", ":"))
+
 
 class StartResponse(Protocol):
     """WSGI start_response callable protocol."""
@@ -38,7 +52,10 @@ class HealthCheck:
             app_name: Name of the application for health check responses.
         """
         self.app_name = app_name
+        # Wall-clock start for reporting; uptime uses the monotonic clock so it
+        # is unaffected by system clock adjustments.
         self.start_time = time.time()
+        self.start_time_ns = time.monotonic_ns()
         self.checks: dict[str, Callable[[], bool]] = {}
 
     def add_check(self, name: str, check_func: Callable[[], bool]) -> None:
@@ -72,7 +89,7 @@ class HealthCheck:
         Returns:
             Dictionary containing application status information.
         """
-        uptime = time.time() - self.start_time
+        uptime = (time.monotonic_ns() - self.start_time_ns) / 1e9
         healthy = self.is_healthy()
 
         status: dict[str, Any] = {
@@ -129,20 +146,43 @@ class SimpleWSGIRouter:
             start_response: WSGI start_response callable.
 
         Returns:
-            Response body as list of bytes.
+            Response body as an iterable of bytes.
+        """
+        if environ.get("REQUEST_METHOD", "GET") != "GET":
+            return self._method_not_allowed(environ, start_response)
+
+        handler = self.routes.get(environ.get("PATH_INFO", ""), self._not_found)
+        return handler(environ, start_response)
+
+    def _method_not_allowed(
+        self, _environ: dict[str, Any], start_response: StartResponse
+    ) -> Iterable[bytes]:
+        """Fallback for any request method other than GET.
+
+        Args:
+            environ: WSGI environment dictionary.
+            start_response: WSGI start_response callable.
+
+        Returns:
+            Response body as an iterable of bytes.
         """
-        path = environ.get("PATH_INFO", "")
-        method = environ.get("REQUEST_METHOD", "GET")
+        start_response("405 Method Not Allowed", list(_TEXT_HEADERS))
+        return _METHOD_NOT_ALLOWED_BODY
 
-        if method != "GET":
-            start_response("405 Method Not Allowed", [("Content-Type", "text/plain")])
-            return [b"Method Not Allowed"]
+    def _not_found(
+        self, _environ: dict[str, Any], start_response: StartResponse
+    ) -> Iterable[bytes]:
+        """Fallback for paths with no registered route.
 
-        handler = self.routes.get(path)
-        if handler:
-            return handler(environ, start_response)
-        start_response("404 Not Found", [("Content-Type", "text/plain")])
-        return [b"Not Found"]
+        Args:
+            environ: WSGI environment dictionary.
+            start_response: WSGI start_response callable.
+
+        Returns:
+            Response body as an iterable of bytes.
+        """
+        start_response("404 Not Found", list(_TEXT_HEADERS))
+        return _NOT_FOUND_BODY
 
     def _health_endpoint(
         self, _environ: dict[str, Any], start_response: StartResponse
@@ -154,16 +194,14 @@ class SimpleWSGIRouter:
             start_response: WSGI start_response callable.
 
         Returns:
-            Response body as list of bytes.
+            Response body as an iterable of bytes.
         """
         with log_bind(endpoint="health"), observe_around(logger, "HEALTH_CHECK"):
             healthy = self.health_check.is_healthy()
             status_code = "200 OK" if healthy else "503 Service Unavailable"
-            status_text = "healthy" if healthy else "unhealthy"
 
-            start_response(status_code, [("Content-Type", "application/json")])
-            response = {"status": status_text}
-            return [json.dumps(response).encode("utf-8")]
+            start_response(status_code, list(_JSON_HEADERS))
+            return _HEALTHY_BODY if healthy else _UNHEALTHY_BODY
 
     def _status_endpoint(
         self, _environ: dict[str, Any], start_response: StartResponse
@@ -175,7 +213,7 @@ class SimpleWSGIRouter:
             start_response: WSGI start_response callable.
 
         Returns:
-            Response body as list of bytes.
+            Response body as an iterable of bytes.
         """
         with log_bind(endpoint="status"), observe_around(logger, "STATUS_CHECK"):
             status = self.health_check.get_status()
@@ -183,12 +221,12 @@ class SimpleWSGIRouter:
                 "200 OK" if status["status"] == "healthy" else "503 Service Unavailable"
             )
 
-            start_response(status_code, [("Content-Type", "application/json")])
-            return [json.dumps(status, indent=2).encode("utf-8")]
+            start_response(status_code, list(_JSON_HEADERS))
+            return [_STATUS_ENCODER.encode(status).encode("utf-8")]
 
     def _heartbeat_endpoint(
         self, _environ: dict[str, Any], start_response: StartResponse
-    ) -> list[bytes]:
+    ) -> Iterable[bytes]:
         """Heartbeat endpoint - lightweight health check for load balancers.
 
         Args:
@@ -196,14 +234,14 @@ class SimpleWSGIRouter:
             start_response: WSGI start_response callable.
 
         Returns:
-            Response body as list of bytes.
+            Response body as an iterable of bytes.
         """
         with log_bind(endpoint="heartbeat"), observe_around(logger, "HEARTBEAT_CHECK"):
             healthy = self.health_check.is_healthy()
             status_code = "200 OK" if healthy else "503 Service Unavailable"
 
-            start_response(status_code, [("Content-Type", "text/plain")])
-            return [b"OK" if healthy else b"FAIL"]
+            start_response(status_code, list(_TEXT_HEADERS))
+            return _OK_BODY if healthy else _FAIL_BODY
 
 
 def create_health_app(app_name: str = "data-transformer-app") -> SimpleWSGIRouter:
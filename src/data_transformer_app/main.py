@@ -10,7 +10,7 @@ import os
 import sys
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, cast
-from wsgiref.simple_server import make_server
+from wsgiref.simple_server import WSGIServer, make_server
 
 import structlog
 
@@ -212,6 +212,27 @@ def run_command(args: list[str] | None = None) -> None:
         sys.exit(1)
 
 
+def create_health_server(host: str, port: int) -> WSGIServer:
+    """Create a WSGI server bound to the health check endpoints.
+
+    The server is bound but not yet serving; callers decide how to run it
+    (e.g. ``serve_forever`` in the foreground or on a background thread).
+
+    Args:
+        host: Host interface to bind to.
+        port: Port to bind to. Use 0 to let the OS pick a free port.
+
+    Returns:
+        Bound WSGI server instance.
+    """
+    app = create_health_app()
+    return make_server(
+        host,
+        port,
+        cast("Callable[[dict[str, Any], StartResponse], Any]", app),
+    )
+
+
 def health_command(args: list[str] | None = None) -> None:
     """Start a health check server.
 
@@ -231,18 +252,9 @@ def health_command(args: list[str] | None = None) -> None:
             console_mode=ConsoleMode.FORCE if config.dev_mode else ConsoleMode.AUTO,
         )
 
-        # Create health check app
-        app = create_health_app()
-
-        # Import wsgiref for simple WSGI server
-
         logger.info("HEALTH_CHECK_SERVER_STARTING", host=config.host, port=config.port)
 
-        with make_server(
-            config.host,
-            config.port,
-            cast("Callable[[dict[str, Any], StartResponse], Any]", app),
-        ) as httpd:
+        with create_health_server(config.host, config.port) as httpd:
             logger.info(
                 "HEALTH_CHECK_SERVER_STARTED",
                 host=config.host,
@@ -6,14 +6,15 @@ utilities that are used across multiple test files.
 
 import asyncio
 import atexit
+import inspect
 import os
 import signal
 import subprocess
 import sys
-import tempfile
 import uuid
-from collections.abc import AsyncGenerator, Coroutine, Generator
+from collections.abc import AsyncGenerator, Callable, Coroutine, Generator
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -323,12 +324,34 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop]:
 
 
 @pytest.fixture
-def temp_dir() -> Generator[str]:
+def temp_dir(tmp_path: Path) -> str:
     """Create a temporary directory for testing."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+    return str(tmp_path)
 
 
+@pytest.fixture
+async def teardown_checks() -> AsyncGenerator[Callable[[Callable[[], Any]], None]]:
+    """Register cleanups that are all run when the test tears down.
+
+    Cleanups run in LIFO order and may return an awaitable, which is awaited.
+    Every cleanup runs even if an earlier one raises, so one failure cannot
+    leak the remaining processes or connections; errors are reported together
+    once all cleanups have run.
+    """
+    cleanups: list[Callable[[], Any]] = []
+
+    yield cleanups.append
+
+    errors: list[Exception] = []
+    for cleanup in reversed(cleanups):
+        try:
+            result = cleanup()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            errors.append(e)
+    assert not errors, f"Teardown failed: {errors!r}"
+
 
 def create_test_stream(content: bytes) -> AsyncGenerator[bytes]:
     """Create a test stream from bytes."""
@@ -406,9 +429,13 @@ def localstack_container() -> DockerContainer:
         pytest.fail(f"Failed to start localstack container: {e}")
 
 
-@pytest.fixture(scope="class")
+@pytest.fixture(scope="session")
 def redis_container() -> DockerContainer:
-    """Start Redis container for testing."""
+    """Start Redis container for testing.
+
+    Session-scoped so the container is started once per pytest session (per
+    xdist worker); tests isolate their data by flushing the DB on teardown.
+    """
     # Fail if running in CI without Docker
     if os.getenv("CI") and not os.path.exists("/var/run/docker.sock"):
         pytest.fail("Docker not available in CI environment")
@@ -462,6 +489,29 @@ def redis_container() -> DockerContainer:
         pytest.fail(f"Failed to start Redis container: {e}")
 
 
+@dataclass(frozen=True)
+class RedisEndpoint:
+    """Connection details for the Redis test container."""
+
+    host: str
+    port: int
+
+
+@pytest.fixture(scope="session")
+def redis_endpoint(redis_container: DockerContainer) -> RedisEndpoint:
+    """Host and port of the Redis test container.
+
+    Resolved once per session, which under pytest-xdist is once per worker,
+    each with its own container. Both lookups query the Docker daemon, so
+    tests that only need to connect should depend on this rather than on
+    ``redis_container`` directly.
+    """
+    return RedisEndpoint(
+        host=redis_container.get_container_host_ip(),
+        port=int(redis_container.get_exposed_port(6379)),
+    )
+
+
 @pytest.fixture
 def s3_client(localstack_container: DockerContainer) -> Any:
     """Create S3 client connected to localstack."""
@@ -641,13 +691,37 @@ def parallel_containers() -> Generator[tuple[DockerContainer, DockerContainer]]:
         pytest.fail(f"Failed to start parallel containers: {e}")
 
 
-# Mark tests that require Docker/localstack
+def _ram_backed_temproot() -> str | None:
+    """Pick a RAM-backed root for pytest's temporary directories.
+
+    Returns ``/dev/shm`` when it exists and is writable, otherwise None to
+    keep pytest's default location.
+    """
+    root = "/dev/shm"
+    if not Path(root).is_dir() or not os.access(root, os.W_OK):
+        return None
+    return root
+
+
+@pytest.hookimpl(tryfirst=True)
 def pytest_configure(config: Any) -> None:
-    """Configure pytest with custom markers and signal handling."""
+    """Configure pytest with custom markers, signal handling and temp dirs."""
+    # Keep fixture files in RAM. Pointing pytest's temp root there (rather
+    # than fixing --basetemp) keeps its per-user, numbered pytest-N
+    # directories, so concurrent runs never delete each other's trees
+    if (
+        config.option.basetemp is None
+        and "PYTEST_DEBUG_TEMPROOT" not in os.environ
+    ):
+        temproot = _ram_backed_temproot()
+        if temproot is not None:
+            os.environ["PYTEST_DEBUG_TEMPROOT"] = temproot
+
     # Set up signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, _signal_handler)
     signal.signal(signal.SIGTERM, _signal_handler)
 
+    # Mark tests that require Docker/localstack
     config.addinivalue_line(
         "markers", "localstack: mark test as requiring localstack container"
     )
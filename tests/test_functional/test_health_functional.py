@@ -4,115 +4,186 @@ This module contains functional tests that test the health check
 endpoints in a more realistic environment.
 """
 
-import json
+import asyncio
+import signal
+import socket
 import subprocess
+import sys
+import threading
 import time
+from collections.abc import AsyncGenerator, Callable, Generator
 from pathlib import Path
+from typing import Any
 
+import httpx
 import pytest
-import requests
 
+from data_transformer_app.main import create_health_server
+
+# Upper bound on how long a spawned health server may take to bind its port
+_STARTUP_TIMEOUT_SECONDS = 5.0
+_STARTUP_POLL_INTERVAL_SECONDS = 0.05
+
+
+def _wait_for_port(
+    process: subprocess.Popen[bytes], port: int, output_path: Path
+) -> None:
+    """Block until the health server accepts connections on ``port``.
+
+    Polls with a raw TCP connect instead of sleeping for a fixed period, so
+    tests start as soon as the server is ready. Fails the test straight away
+    with the exit code and ``output_path`` contents if the server exits, or
+    if it does not bind within ``_STARTUP_TIMEOUT_SECONDS``.
+    """
+    deadline = time.monotonic() + _STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        returncode = process.poll()
+        if returncode is not None:
+            pytest.fail(
+                f"Health server exited with code {returncode} before binding "
+                f"port {port}:\n{output_path.read_text()}"
+            )
+        with socket.socket() as sock:
+            sock.settimeout(0.1)
+            try:
+                sock.connect(("127.0.0.1", port))
+            except OSError:
+                time.sleep(_STARTUP_POLL_INTERVAL_SECONDS)
+            else:
+                return
+    process.terminate()
+    pytest.fail(
+        f"Health server did not start on port {port}:\n{output_path.read_text()}"
+    )
+
+
+def _stop_process(process: subprocess.Popen[bytes]) -> None:
+    """Terminate ``process`` if still running, killing it if it will not exit."""
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
 
-class TestHealthFunctional:
-    """Functional tests for health check endpoints."""
 
-    @pytest.fixture
-    def health_server_process(self, temp_dir: str):
-        """Start a health check server process for testing."""
-        # Create a simple test script that starts the health server
-        test_script = Path(temp_dir) / "test_health_server.py"
-        test_script.write_text('''
-import sys
-import os
-from pathlib import Path
+@pytest.fixture(scope="module")
+def health_server() -> Generator[tuple[str, int]]:
+    """Run the health check server in-process on an ephemeral port.
 
-# Add src to path
-src_path = Path(__file__).resolve().parents[2] / "src"
-sys.path.insert(0, str(src_path))
+    Serving from a daemon thread avoids spawning an interpreter per test, and
+    binding to port 0 keeps parallel pytest-xdist workers from colliding.
+    """
+    server = create_health_server("127.0.0.1", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
 
-from data_transformer_app.main import health_command
+    yield server.server_address[0], server.server_address[1]
 
-if __name__ == "__main__":
-    # Start health server on port 8081 to avoid conflicts
-    health_command(["--port", "8081", "--host", "127.0.0.1"])
-''')
-        
-        # Start the health server process
-        process = subprocess.Popen(
-            [sys.executable, str(test_script)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=temp_dir,
-        )
-        
-        # Wait a moment for the server to start
-        time.sleep(2)
-        
-        yield process
-        
-        # Clean up
-        process.terminate()
-        try:
-            process.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            process.kill()
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
 
-    def test_health_endpoint_functional(self, health_server_process):
+
+@pytest.fixture(scope="module")
+async def http_client(
+    health_server: tuple[str, int],
+) -> AsyncGenerator[httpx.AsyncClient]:
+    """Async HTTP client shared by the module's tests.
+
+    The wsgiref server answers HTTP/1.0 and closes the connection after each
+    response, so every request still opens its own TCP connection; sharing
+    the client only saves building one per test.
+    """
+    host, port = health_server
+    async with httpx.AsyncClient(
+        base_url=f"http://{host}:{port}", timeout=5
+    ) as client:
+        yield client
+
+
+class TestHealthFunctional:
+    """Functional tests for health check endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_health_endpoint_functional(
+        self, http_client: httpx.AsyncClient
+    ) -> None:
         """Test health endpoint functionality."""
-        try:
-            response = requests.get("http://127.0.0.1:8081/health", timeout=5)
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "status" in data
-            assert data["status"] in ["healthy", "unhealthy"]
-        except requests.exceptions.RequestException:
-            pytest.skip("Health server not accessible")
-
-    def test_status_endpoint_functional(self, health_server_process):
+        response = await http_client.get("/health")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert "status" in data
+        assert data["status"] in ["healthy", "unhealthy"]
+
+    @pytest.mark.asyncio
+    async def test_status_endpoint_functional(
+        self, http_client: httpx.AsyncClient
+    ) -> None:
         """Test status endpoint functionality."""
-        try:
-            response = requests.get("http://127.0.0.1:8081/status", timeout=5)
-            assert response.status_code == 200
-            
-            data = response.json()
-            assert "app_name" in data
-            assert "status" in data
-            assert "uptime_seconds" in data
-            assert "timestamp" in data
-            assert "checks" in data
-            assert isinstance(data["checks"], dict)
-        except requests.exceptions.RequestException:
-            pytest.skip("Health server not accessible")
-
-    def test_heartbeat_endpoint_functional(self, health_server_process):
+        response = await http_client.get("/status")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert "app_name" in data
+        assert "status" in data
+        assert "uptime_seconds" in data
+        assert "timestamp" in data
+        assert "checks" in data
+        assert isinstance(data["checks"], dict)
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_endpoint_functional(
+        self, http_client: httpx.AsyncClient
+    ) -> None:
         """Test heartbeat endpoint functionality."""
-        try:
-            response = requests.get("http://127.0.0.1:8081/heartbeat", timeout=5)
-            assert response.status_code == 200
-            
-            # Heartbeat should return plain text
-            assert response.text in ["OK", "FAIL"]
-        except requests.exceptions.RequestException:
-            pytest.skip("Health server not accessible")
-
-    def test_health_endpoint_404(self, health_server_process):
+        response = await http_client.get("/heartbeat")
+        assert response.status_code == 200
+
+        # Heartbeat should return plain text
+        assert response.text in ["OK", "FAIL"]
+
+    @pytest.mark.asyncio
+    async def test_endpoints_probed_together(
+        self, http_client: httpx.AsyncClient
+    ) -> None:
+        """Test that all endpoints answer when requested at the same time.
+
+        The single-threaded wsgiref server still handles the requests one
+        after another; this checks that none of them is dropped or mixed up.
+        """
+        health, status, heartbeat = await asyncio.gather(
+            http_client.get("/health"),
+            http_client.get("/status"),
+            http_client.get("/heartbeat"),
+        )
+
+        assert health.status_code == 200
+        assert status.status_code == 200
+        assert heartbeat.status_code == 200
+        assert health.json()["status"] == status.json()["status"]
+
+    @pytest.mark.asyncio
+    async def test_health_endpoint_404(self, http_client: httpx.AsyncClient) -> None:
         """Test that unknown endpoints return 404."""
-        try:
-            response = requests.get("http://127.0.0.1:8081/unknown", timeout=5)
-            assert response.status_code == 404
-        except requests.exceptions.RequestException:
-            pytest.skip("Health server not accessible")
+        response = await http_client.get("/unknown")
+        assert response.status_code == 404
 
-    def test_health_endpoint_method_not_allowed(self, health_server_process):
+    @pytest.mark.asyncio
+    async def test_health_endpoint_method_not_allowed(
+        self, http_client: httpx.AsyncClient
+    ) -> None:
         """Test that POST requests return 405."""
-        try:
-            response = requests.post("http://127.0.0.1:8081/health", timeout=5)
-            assert response.status_code == 405
-        except requests.exceptions.RequestException:
-            pytest.skip("Health server not accessible")
+        response = await http_client.post("/health")
+        assert response.status_code == 405
 
-    def test_health_server_startup_and_shutdown(self, temp_dir: str):
+    @pytest.mark.slow
+    def test_health_server_startup_and_shutdown(
+        self, temp_dir: str, teardown_checks: Callable[[Callable[[], Any]], None]
+    ) -> None:
         """Test that health server can start and stop cleanly."""
         # Create a simple test script
         test_script = Path(temp_dir) / "test_health_lifecycle.py"
@@ -146,27 +217,31 @@ if __name__ == "__main__":
         sys.exit(1)
 ''')
         
-        # Start the process
-        process = subprocess.Popen(
-            [sys.executable, str(test_script)],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            cwd=temp_dir,
-        )
-        
+        # Start the process; output goes to a file rather than a pipe, which
+        # nothing drains and whose full buffer would block the server
+        output_path = Path(temp_dir) / "health_server.log"
+        with output_path.open("wb") as output:
+            process = subprocess.Popen(
+                [sys.executable, str(test_script)],
+                stdout=output,
+                stderr=subprocess.STDOUT,
+                cwd=temp_dir,
+            )
+        teardown_checks(lambda: _stop_process(process))
+
         # Wait for startup
-        time.sleep(2)
+        _wait_for_port(process, 8082, output_path)
         
         # Verify it's running
         assert process.poll() is None
         
         # Send SIGTERM to test graceful shutdown
-        process.terminate()
-        
-        # Wait for shutdown
+        process.send_signal(signal.SIGTERM)
+
+        # Wait for shutdown; the script's SIGTERM handler exits 0, so any
+        # other code (including -SIGTERM) means the handler did not run
         try:
-            process.wait(timeout=10)
-            assert process.returncode == 0
+            process.wait(timeout=3)
         except subprocess.TimeoutExpired:
-            process.kill()
             pytest.fail("Health server did not shutdown gracefully")
+        assert process.returncode == 0
@@ -5,9 +5,10 @@ including real Redis container testing, connection management, and data state ma
 """
 
 import asyncio
+import json
 import time
-from collections.abc import AsyncGenerator
-from typing import Any
+from collections.abc import AsyncGenerator, Callable
+from typing import TYPE_CHECKING, Any
 
 import pytest
 import redis.asyncio as redis
@@ -16,51 +17,97 @@ from data_transformer_core.kv_store import (
     RedisKeyValueStore,
 )
 
+if TYPE_CHECKING:
+    from tests.conftest import RedisEndpoint
+
+
+# Throughput plateaus beyond a handful of connections; keep the pool small
+_REDIS_POOL_MAX_CONNECTIONS = 16
+
+
+@pytest.fixture(scope="session")
+async def redis_pool(
+    redis_endpoint: "RedisEndpoint",
+) -> AsyncGenerator[redis.ConnectionPool]:
+    """Connection pool shared by every Redis client in the session."""
+    pool = redis.ConnectionPool(
+        host=redis_endpoint.host,
+        port=redis_endpoint.port,
+        db=0,
+        decode_responses=False,  # Keep as bytes for testing
+        max_connections=_REDIS_POOL_MAX_CONNECTIONS,
+    )
+
+    yield pool
+
+    await pool.disconnect()
+
 
 @pytest.mark.integration
 class TestRedisIntegration:
     """Integration tests for Redis key-value store functionality."""
 
     @pytest.fixture
-    async def redis_client(self, redis_container: Any) -> AsyncGenerator[redis.Redis]:
+    async def redis_client(
+        self,
+        redis_pool: redis.ConnectionPool,
+        teardown_checks: Callable[[Callable[[], Any]], None],
+    ) -> redis.Redis:
         """Create Redis client connected to test container."""
-        # In Docker-in-Docker, use the container's internal network
-        client = redis.Redis(
-            host=redis_container.get_container_host_ip(),
-            port=redis_container.get_exposed_port(6379),
-            db=0,
-            decode_responses=False,  # Keep as bytes for testing
-        )
+        # Clients built on an explicit pool leave it open on aclose()
+        client = redis.Redis(connection_pool=redis_pool)
+        # redis-py asyncio deprecates close() in favor of aclose() in 5.0.1
+        teardown_checks(client.aclose)
 
         # Test connection
         await client.ping()
 
-        yield client
+        return client
 
-        # Cleanup
-        await client.flushdb()
-        # redis-py asyncio deprecates close() in favor of aclose() in 5.0.1
-        await client.aclose()
+    @pytest.fixture(autouse=True)
+    def _flush_redis(
+        self,
+        redis_client: redis.Redis,
+        teardown_checks: Callable[[Callable[[], Any]], None],
+    ) -> None:
+        """Flush the shared Redis DB after every test."""
+        teardown_checks(redis_client.flushdb)
 
     @pytest.fixture
-    async def redis_store(
-        self, redis_container: Any
-    ) -> AsyncGenerator[RedisKeyValueStore]:
-        """Create RedisKeyValueStore instance for testing."""
-        # In Docker-in-Docker, use the container's internal network
-        store = RedisKeyValueStore(
-            host=redis_container.get_container_host_ip(),
-            port=redis_container.get_exposed_port(6379),
-            db=0,
-            key_prefix="test:",
-            serializer="json",
-            default_ttl=3600,
-        )
+    def make_store(
+        self,
+        redis_endpoint: "RedisEndpoint",
+        request: pytest.FixtureRequest,
+        teardown_checks: Callable[[Callable[[], Any]], None],
+    ) -> Callable[..., RedisKeyValueStore]:
+        """Factory for RedisKeyValueStore instances scoped to the current test.
+
+        Stores share DB 0 of the session's container and are namespaced by a
+        key prefix derived from the test name; ``namespace`` is appended to that prefix
+        and any other keyword overrides the store defaults. Every created store
+        is closed on teardown.
+        """
 
-        yield store
+        def _make_store(namespace: str = "", **overrides: Any) -> RedisKeyValueStore:
+            kwargs: dict[str, Any] = {
+                "host": redis_endpoint.host,
+                "port": redis_endpoint.port,
+                "db": 0,
+                "key_prefix": f"{request.node.name}:{namespace}",
+            }
+            kwargs.update(overrides)
+            store = RedisKeyValueStore(**kwargs)
+            teardown_checks(store.close)
+            return store
 
-        # Cleanup
-        await store.close()
+        return _make_store
+
+    @pytest.fixture
+    def redis_store(
+        self, make_store: Callable[..., RedisKeyValueStore]
+    ) -> RedisKeyValueStore:
+        """Create RedisKeyValueStore instance for testing."""
+        return make_store(key_prefix="test:", serializer="json", default_ttl=3600)
 
     @pytest.mark.asyncio
     async def test_redis_connection_establishment(
@@ -88,8 +135,7 @@ class TestRedisIntegration:
         await redis_store.put("user:123", test_data)
 
         # Verify data exists in Redis
-        raw_value = await redis_client.get("test:user:123")
-        assert raw_value is not None
+        assert await redis_client.exists("test:user:123") == 1
 
         # Verify data can be retrieved through store
         retrieved_data = await redis_store.get("user:123")
@@ -103,18 +149,19 @@ class TestRedisIntegration:
         # Store data with short TTL
         await redis_store.put("temp_key", "temp_value", ttl=1)
 
-        # Verify key exists immediately
+        # Verify key exists immediately with the TTL applied
         assert await redis_store.exists("temp_key") is True
+        assert 0 < await redis_client.pttl("test:temp_key") <= 1000
 
-        # Wait for expiration (reduced from 2.1 to 1.1 seconds)
-        await asyncio.sleep(1.1)
+        # Force near-immediate expiry instead of waiting out the real TTL
+        await redis_client.pexpire("test:temp_key", 1)
+        await asyncio.sleep(0.05)
 
         # Verify key has expired
         assert await redis_store.exists("temp_key") is False
 
         # Verify key is gone from Redis
-        raw_value = await redis_client.get("test:temp_key")
-        assert raw_value is None
+        assert await redis_client.exists("test:temp_key") == 0
 
     @pytest.mark.asyncio
     async def test_redis_key_prefixing(
@@ -141,8 +188,12 @@ class TestRedisIntegration:
     ) -> None:
         """Test Redis range operations with real data."""
         # Store multiple keys
-        for i in range(10):
-            await redis_store.put(f"user:{i}", {"id": i, "name": f"User {i}"})
+        await asyncio.gather(
+            *(
+                redis_store.put(f"user:{i}", {"id": i, "name": f"User {i}"})
+                for i in range(10)
+            )
+        )
 
         # Test range get with start key
         results = await redis_store.range_get("user:3")
@@ -157,61 +208,42 @@ class TestRedisIntegration:
         assert len(results) == 5
 
     @pytest.mark.asyncio
-    async def test_redis_serialization_options(self, redis_container: Any) -> None:
+    async def test_redis_serialization_options(
+        self, make_store: Callable[..., RedisKeyValueStore]
+    ) -> None:
         """Test Redis with different serialization options."""
-        # In Docker-in-Docker, use the container's internal network
-        host = redis_container.get_container_host_ip()
-        port = redis_container.get_exposed_port(6379)
-
         # Test JSON serialization
-        json_store = RedisKeyValueStore(
-            host=host,
-            port=port,
-            db=1,  # Use different DB to avoid conflicts
-            serializer="json",
-            key_prefix="json:",
-        )
+        json_store = make_store(namespace="json:", serializer="json")
 
         # Test pickle serialization
-        pickle_store = RedisKeyValueStore(
-            host=host,
-            port=port,
-            db=2,  # Use different DB to avoid conflicts
-            serializer="pickle",
-            key_prefix="pickle:",
-        )
-
-        try:
-            # Test JSON serialization
-            complex_data = {
-                "string": "test",
-                "number": 42,
-                "list": [1, 2, 3],
-                "dict": {"nested": "value"},
-            }
+        pickle_store = make_store(namespace="pickle:", serializer="pickle")
 
-            await json_store.put("complex", complex_data)
-            retrieved = await json_store.get("complex")
-            assert retrieved == complex_data
+        # Test JSON serialization
+        complex_data = {
+            "string": "test",
+            "number": 42,
+            "list": [1, 2, 3],
+            "dict": {"nested": "value"},
+        }
 
-            # Test pickle serialization with more complex types
-            import datetime
+        await json_store.put("complex", complex_data)
+        retrieved = await json_store.get("complex")
+        assert retrieved == complex_data
 
-            complex_pickle_data = {
-                "datetime": datetime.datetime.now(),
-                "set_data": {1, 2, 3},
-                "bytes_data": b"binary_data",
-            }
+        # Test pickle serialization with more complex types
+        import datetime
 
-            await pickle_store.put("complex", complex_pickle_data)
-            retrieved = await pickle_store.get("complex")
-            assert retrieved is not None
-            assert retrieved["set_data"] == complex_pickle_data["set_data"]  # type: ignore[index]
-            assert retrieved["bytes_data"] == complex_pickle_data["bytes_data"]  # type: ignore[index]
+        complex_pickle_data = {
+            "datetime": datetime.datetime.now(),
+            "set_data": {1, 2, 3},
+            "bytes_data": b"binary_data",
+        }
 
-        finally:
-            await json_store.close()
-            await pickle_store.close()
+        await pickle_store.put("complex", complex_pickle_data)
+        retrieved = await pickle_store.get("complex")
+        assert retrieved is not None
+        assert retrieved["set_data"] == complex_pickle_data["set_data"]  # type: ignore[index]
+        assert retrieved["bytes_data"] == complex_pickle_data["bytes_data"]  # type: ignore[index]
 
     @pytest.mark.asyncio
     async def test_redis_connection_recovery(
@@ -252,34 +284,53 @@ class TestRedisIntegration:
         """Test Redis bulk operations for performance."""
         # Store fewer keys for faster execution (reduced from 100 to 20)
         start_time = time.time()
-        for i in range(20):
-            await redis_store.put(f"bulk_key_{i}", f"bulk_value_{i}")
+        await asyncio.gather(
+            *(redis_store.put(f"bulk_key_{i}", f"bulk_value_{i}") for i in range(20))
+        )
         store_time = time.time() - start_time
 
         # Retrieve fewer keys for faster execution
         start_time = time.time()
-        for i in range(20):
-            value = await redis_store.get(f"bulk_key_{i}")
-            assert value == f"bulk_value_{i}"
+        values = await asyncio.gather(
+            *(redis_store.get(f"bulk_key_{i}") for i in range(20))
+        )
         retrieve_time = time.time() - start_time
 
+        assert values == [f"bulk_value_{i}" for i in range(20)]
+
         # Verify performance is reasonable (should be fast)
         assert store_time < 2.0  # Should store 20 keys in under 2 seconds
         assert retrieve_time < 2.0  # Should retrieve 20 keys in under 2 seconds
 
     @pytest.mark.asyncio
-    async def test_redis_context_manager(self, redis_container: Any) -> None:
+    async def test_redis_pipelined_bulk_operations(
+        self, redis_store: RedisKeyValueStore, redis_client: redis.Redis
+    ) -> None:
+        """Test that pipelined writes are readable through the store."""
+        # Batch all writes into a single round-trip
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for i in range(20):
+                pipe.set(f"test:pipe_key_{i}", json.dumps(f"pipe_value_{i}"))
+            results = await pipe.execute()
+        assert all(results)
+
+        # Batch all reads into a single round-trip
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for i in range(20):
+                pipe.exists(f"test:pipe_key_{i}")
+            exists_results = await pipe.execute()
+        assert exists_results == [1] * 20
+
+        # Verify the store deserializes the pipelined values
+        assert await redis_store.get("pipe_key_0") == "pipe_value_0"
+        assert await redis_store.get("pipe_key_19") == "pipe_value_19"
+
+    @pytest.mark.asyncio
+    async def test_redis_context_manager(
+        self, make_store: Callable[..., RedisKeyValueStore]
+    ) -> None:
         """Test Redis store as context manager."""
-        # In Docker-in-Docker, use the container's internal network
-        host = redis_container.get_container_host_ip()
-        port = redis_container.get_exposed_port(6379)
-
-        async with RedisKeyValueStore(
-            host=host,
-            port=port,
-            db=3,
-            key_prefix="context:",
-        ) as store:
+        async with make_store(namespace="context:") as store:
             # Store data
             await store.put("context_key", "context_value")
 
@@ -290,46 +341,34 @@ class TestRedisIntegration:
         # Store should be closed automatically
 
     @pytest.mark.asyncio
-    async def test_redis_direct_store_integration(self, redis_container: Any) -> None:
+    async def test_redis_direct_store_integration(
+        self, make_store: Callable[..., RedisKeyValueStore]
+    ) -> None:
         """Test Redis integration with direct store instance.
 
         This test verifies that Redis store operations work correctly
         when using the store instance directly (no global state).
         """
-        # In Docker-in-Docker, use the container's internal network
-        host = redis_container.get_container_host_ip()
-        port = redis_container.get_exposed_port(6379)
-
         # Create store instance directly
-        store = RedisKeyValueStore(
-            host=host,
-            port=port,
-            db=4,
-            key_prefix="test_direct:",
-            serializer="json",
-            default_ttl=3600,
+        store = make_store(
+            namespace="test_direct:", serializer="json", default_ttl=3600
         )
 
-        try:
-            # Test operations
-            await store.put("test_key", "test_value")
-            result = await store.get("test_key")
-            assert result == "test_value"
-
-            # Test range operations
-            await store.put("user:1", {"id": 1, "name": "User 1"})
-            await store.put("user:2", {"id": 2, "name": "User 2"})
+        # Test operations
+        await store.put("test_key", "test_value")
+        result = await store.get("test_key")
+        assert result == "test_value"
 
-            results = await store.range_get("user:")
-            assert len(results) == 2
+        # Test range operations
+        await store.put("user:1", {"id": 1, "name": "User 1"})
+        await store.put("user:2", {"id": 2, "name": "User 2"})
 
-            # Test delete
-            assert await store.delete("test_key") is True
-            assert await store.exists("test_key") is False
+        results = await store.range_get("user:")
+        assert len(results) == 2
 
-        finally:
-            # Clean up store
-            await store.close()
+        # Test delete
+        assert await store.delete("test_key") is True
+        assert await store.exists("test_key") is False
 
     @pytest.mark.asyncio
     async def test_redis_concurrent_access(
@@ -359,9 +398,10 @@ class TestRedisIntegration:
         )
 
         # Verify all writes succeeded
-        for i in range(10):
-            value = await redis_store.get(f"concurrent_{i}")
-            assert value == f"value_{i}"
+        values = await asyncio.gather(
+            *(redis_store.get(f"concurrent_{i}") for i in range(10))
+        )
+        assert values == [f"value_{i}" for i in range(10)]
 
         # Verify all reads succeeded
         for result in read_results:
@@ -390,12 +430,12 @@ class TestRedisIntegration:
         assert retrieved["moderate_list"] == moderate_data["moderate_list"]  # type: ignore[index]
         assert retrieved["moderate_dict"] == moderate_data["moderate_dict"]  # type: ignore[index]
 
-        # Check Redis memory usage
-        info = await redis_client.info("memory")
-        used_memory = int(info["used_memory"])
+        # Check memory used by this key alone rather than the whole server
+        key_memory = await redis_client.memory_usage("test:moderate_data")
 
-        # Memory usage should be reasonable (under 10MB for this test)
-        assert used_memory < 10 * 1024 * 1024
+        # Roughly 4KB of serialized data should stay well under 200KB in Redis
+        assert key_memory is not None
+        assert key_memory < 200_000
 
     @pytest.mark.asyncio
     async def test_redis_cleanup_and_maintenance(
@@ -407,8 +447,14 @@ class TestRedisIntegration:
         await redis_store.put("expires_soon", "expires_soon_value", ttl=1)
         await redis_store.put("expires_later", "expires_later_value", ttl=5)
 
-        # Wait for first expiration (reduced from 1.1 to 1.1 seconds)
-        await asyncio.sleep(1.1)
+        # Verify the TTLs were applied
+        assert await redis_client.pttl("test:permanent") > 5000  # default_ttl
+        assert 0 < await redis_client.pttl("test:expires_soon") <= 1000
+        assert 1000 < await redis_client.pttl("test:expires_later") <= 5000
+
+        # Force near-immediate expiry instead of waiting out the real TTL
+        await redis_client.pexpire("test:expires_soon", 1)
+        await asyncio.sleep(0.05)
 
         # Check what's still there
         assert await redis_store.exists("permanent") is True
@@ -0,0 +1,53 @@
+"""Shared fixtures for data transformer core integration tests.
+
+The Redis container itself is session-scoped in the top-level conftest; the
+fixtures here build KV stores against it and isolate tests by flushing the
+DB on teardown.
+"""
+
+from collections.abc import Callable, Generator
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import redis
+
+if TYPE_CHECKING:
+    from tests.conftest import RedisEndpoint
+
+
+@pytest.fixture
+def redis_kv_store(
+    redis_endpoint: "RedisEndpoint",
+    teardown_checks: Callable[[Callable[[], Any]], None],
+    request: pytest.FixtureRequest,
+) -> Generator[Any]:
+    """Create a Redis-backed KV store on the shared test container.
+
+    The serializer can be selected with indirect parametrization, e.g.
+    ``@pytest.mark.parametrize("redis_kv_store", ["json"], indirect=True)``.
+    Skips when ``data_transformer_core.kv_store`` is not installed, so the
+    other tests in this directory still run without it.
+    """
+    kv_store = pytest.importorskip("data_transformer_core.kv_store")
+    serializer = getattr(request, "param", None)
+
+    kwargs: dict[str, Any] = {}
+    if serializer is not None:
+        kwargs["serializer"] = serializer
+
+    store = kv_store.create_kv_store(
+        store_type="redis",
+        redis_host=redis_endpoint.host,
+        redis_port=redis_endpoint.port,
+        redis_db=0,
+        **kwargs,
+    )
+    # close() may be a coroutine; teardown_checks awaits it if so
+    teardown_checks(store.close)
+    yield store
+
+    # The container outlives this test, so leave no keys behind
+    with redis.Redis(
+        host=redis_endpoint.host, port=redis_endpoint.port, db=0
+    ) as client:
+        client.flushdb()
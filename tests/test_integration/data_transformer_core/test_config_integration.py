@@ -4,8 +4,8 @@ This module contains integration tests for the configuration system,
 including YAML parsing, strategy registry, and basic functionality.
 """
 
-import tempfile
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
@@ -15,11 +15,16 @@ from oc_pipeline_bus.strategy_registry import StrategyFactoryRegistry
 from data_transformer_core.core import DataRegistrytransformerConfig
 from data_transformer_core.strategy_registration import create_strategy_registry
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class TestConfigIntegration:
     """Integration tests for configuration loading."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_config_yaml(self) -> str:
         """Sample YAML configuration for testing."""
         return """
@@ -58,17 +63,26 @@ api_configs:
     retry_attempts: 3
 """
 
-    @pytest.fixture
-    def temp_config_dir(self, sample_config_yaml: str) -> Path:
-        """Create a temporary directory with sample configuration files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_dir = Path(temp_dir)
-            
-            # Create the main configuration file
-            config_file = config_dir / "orchestration.yaml"
-            config_file.write_text(sample_config_yaml)
-            
-            yield config_dir
+    @pytest.fixture(scope="module")
+    def sample_config_data(self, sample_config_yaml: str) -> dict[str, Any]:
+        """Sample YAML configuration parsed once per module."""
+        return yaml.load(sample_config_yaml, Loader=_YamlLoader)
+
+    @pytest.fixture(scope="module")
+    def temp_config_dir(
+        self, sample_config_yaml: str, tmp_path_factory: pytest.TempPathFactory
+    ) -> Path:
+        """Create a temporary directory with sample configuration files.
+
+        Shared by every test in the module; tests must treat it as read-only.
+        """
+        config_dir = tmp_path_factory.mktemp("cfg")
+
+        # Create the main configuration file
+        config_file = config_dir / "orchestration.yaml"
+        config_file.write_text(sample_config_yaml)
+
+        return config_dir
 
     def test_strategy_registry_creation(self) -> None:
         """Test that strategy registry can be created."""
@@ -138,10 +152,10 @@ api_configs:
                 step=None,
             )
 
-    def test_yaml_parsing_validation(self, sample_config_yaml: str) -> None:
+    def test_yaml_parsing_validation(self, sample_config_data: dict[str, Any]) -> None:
         """Test that YAML configuration can be parsed and validated."""
-        config_data = yaml.safe_load(sample_config_yaml)
-        
+        config_data = sample_config_data
+
         # Validate required fields
         assert "config_id" in config_data
         assert "concurrency" in config_data
@@ -182,7 +196,7 @@ storage:
   path: /tmp/test
 """
         
-        config_data = yaml.safe_load(minimal_config)
+        config_data = yaml.load(minimal_config, Loader=_YamlLoader)
         assert config_data["config_id"] == "minimal_test"
         assert config_data["concurrency"] == 1
         assert config_data["target_queue_size"] == 10
@@ -4,6 +4,11 @@ This module contains integration tests for the KV store system,
 including Redis and memory store implementations.
 """
 
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+
 import pytest
 from data_transformer_core.kv_store import create_kv_store
 
@@ -30,19 +35,27 @@ class TestKVStoreIntegration:
         value = kv_store.get("test_key")
         assert value is None
 
-    def test_memory_kv_store_with_ttl(self) -> None:
+    def test_memory_kv_store_with_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test memory KV store with TTL functionality."""
         kv_store = create_kv_store(store_type="memory", default_ttl=1)
-        
+
+        # Give the module that defines the store its own copy of ``time`` with
+        # only the clocks replaced, so expiry can be checked without sleeping,
+        # its other time.* calls keep working and nothing else sees fake time
+        now = [1_000.0]
+        fake_time = SimpleNamespace(**vars(time))
+        fake_time.time = lambda: now[0]
+        fake_time.monotonic = lambda: now[0]
+        monkeypatch.setattr(sys.modules[type(kv_store).__module__], "time", fake_time)
+
         # Set a value with TTL
         kv_store.set("test_key", "test_value", ttl=1)
-        value = kv_store.get("test_key")
-        assert value == "test_value"
-        
-        # Wait for TTL to expire (in a real test, you might use time.sleep)
-        # For this test, we'll just verify the TTL was set
         assert kv_store.get("test_key") == "test_value"
 
+        # Step past the TTL
+        now[0] += 2
+        assert kv_store.get("test_key") is None
+
     def test_memory_kv_store_serialization(self) -> None:
         """Test memory KV store with different serializers."""
         # Test with JSON serializer
@@ -53,72 +66,28 @@ class TestKVStoreIntegration:
         retrieved_data = kv_store_json.get("test_key")
         assert retrieved_data == test_data
 
-    def test_redis_kv_store_creation_with_container(self, redis_container) -> None:
-        """Test creating a Redis-based KV store with container."""
-        import redis
-        
-        # Get Redis connection details
-        host = redis_container.get_container_host_ip()
-        port = redis_container.get_exposed_port(6379)
-        
-        # Create KV store with Redis
-        kv_store = create_kv_store(
-            store_type="redis",
-            redis_host=host,
-            redis_port=port,
-            redis_db=0,
-        )
-        
-        assert kv_store is not None
+    @pytest.mark.parametrize(
+        ("redis_kv_store", "payload"),
+        [
+            (None, "test_value"),
+            ("json", {"key": "value", "number": 42, "nested": {"inner": "data"}}),
+        ],
+        ids=["default", "json"],
+        indirect=["redis_kv_store"],
+    )
+    def test_redis_kv_store_roundtrip(
+        self, redis_kv_store: Any, payload: str | dict[str, Any]
+    ) -> None:
+        """Test Redis KV store creation, set/get and delete with container."""
+        assert redis_kv_store is not None
 
-    def test_redis_kv_store_basic_operations_with_container(self, redis_container) -> None:
-        """Test basic operations with Redis KV store using container."""
-        import redis
-        
-        # Get Redis connection details
-        host = redis_container.get_container_host_ip()
-        port = redis_container.get_exposed_port(6379)
-        
-        # Create KV store with Redis
-        kv_store = create_kv_store(
-            store_type="redis",
-            redis_host=host,
-            redis_port=port,
-            redis_db=0,
-        )
-        
         # Test set and get
-        kv_store.set("test_key", "test_value")
-        value = kv_store.get("test_key")
-        assert value == "test_value"
-        
-        # Test delete
-        kv_store.delete("test_key")
-        value = kv_store.get("test_key")
-        assert value is None
+        redis_kv_store.set("test_key", payload)
+        assert redis_kv_store.get("test_key") == payload
 
-    def test_redis_kv_store_with_serialization(self, redis_container) -> None:
-        """Test Redis KV store with JSON serialization."""
-        import redis
-        
-        # Get Redis connection details
-        host = redis_container.get_container_host_ip()
-        port = redis_container.get_exposed_port(6379)
-        
-        # Create KV store with Redis and JSON serializer
-        kv_store = create_kv_store(
-            store_type="redis",
-            redis_host=host,
-            redis_port=port,
-            redis_db=0,
-            serializer="json",
-        )
-        
-        # Test with complex data
-        test_data = {"key": "value", "number": 42, "nested": {"inner": "data"}}
-        kv_store.set("test_key", test_data)
-        retrieved_data = kv_store.get("test_key")
-        assert retrieved_data == test_data
+        # Test delete
+        redis_kv_store.delete("test_key")
+        assert redis_kv_store.get("test_key") is None
 
     def test_kv_store_error_handling(self) -> None:
         """Test KV store error handling with invalid configuration."""
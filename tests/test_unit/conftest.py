@@ -0,0 +1,242 @@
+"""Shared fixtures for transformer unit tests.
+
+Engines are built once per module against a shared bus double; the
+function-scoped ``mock_bus`` fixture resets that double after every test so
+recorded calls and configured return values never leak between tests.
+"""
+
+import copy
+import json
+import os
+from collections.abc import Callable, Generator, Mapping
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+from oc_pipeline_bus.bus import DataPipelineBus
+from oc_pipeline_bus.identifiers import SnapshotId
+
+from data_transformer_core.engine import TransformEngine
+from data_transformer_core.oc_strategies import (
+    DirectMappingConfig,
+    DirectMappingStrategy,
+    FixedValueConfig,
+    FixedValueStrategy,
+    LookupMappingConfig,
+    LookupMappingStrategy,
+)
+from data_transformer_core.transformer import Transformer
+from data_transformer_core.us_fl_strategies import (
+    DetermineBranchStatusConfig,
+    DetermineBranchStatusStrategy,
+    ParseDateConfig,
+    ParseDateStrategy,
+)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _restore_environ() -> Generator[None]:
+    """Snapshot ``os.environ`` for each module and restore it afterwards.
+
+    Per-test changes should still go through ``monkeypatch``; this bounds any
+    that slip through (``run_command`` exports ``OC_DATA_PIPELINE_*`` and AWS
+    profile variables) to the module that made them. ``TransformEngine``
+    reads ``OC_DATA_PIPELINE_CONFIG_DIR`` when constructed, so a leaked value
+    would change what the module-scoped engines load.
+    """
+    saved = os.environ.copy()
+    yield
+    os.environ.clear()
+    os.environ.update(saved)
+
+
+@pytest.fixture(scope="module")
+def _module_bus() -> Mock:
+    """Pipeline bus double shared by everything built in a test module.
+
+    Specced against ``DataPipelineBus`` so a misspelt or removed bus method
+    fails the test instead of silently returning a child Mock.
+    """
+    return Mock(spec=DataPipelineBus)
+
+
+@pytest.fixture
+def mock_bus(_module_bus: Mock) -> Generator[Mock]:
+    """Shared pipeline bus double, reset once the test finishes."""
+    yield _module_bus
+    _module_bus.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def snapshot_id() -> SnapshotId:
+    """SnapshotId shared by the engine tests, validated once per module."""
+    return SnapshotId("ocid:v1:co:test", "bid:v1:us_fl:test")
+
+
+@pytest.fixture(scope="module")
+def skip_config() -> dict[str, Any]:
+    """Engine config that skips records with a blank name or number."""
+    return {
+        "validation_rules": {
+            "skip_conditions": [
+                {"field": "COR_NAME", "operator": "blank"},
+                {"field": "COR_NUMBER", "operator": "blank"},
+            ]
+        },
+        "company": {},
+    }
+
+
+@pytest.fixture(scope="module")
+def direct_mapping_config() -> dict[str, Any]:
+    """Engine config mapping number/name directly plus a fixed jurisdiction."""
+    return {
+        "validation_rules": {"skip_conditions": []},
+        "company": {
+            "company_number": {
+                "input_source": "COR_NUMBER",
+                "transformation_logic": "oc.direct_mapping",
+            },
+            "name": {
+                "input_source": "COR_NAME",
+                "transformation_logic": "oc.direct_mapping",
+            },
+            "jurisdiction_code": {
+                "transformation_logic": "oc.fixed_value",
+                "fixed_value": "us_fl",
+            },
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def engine_skip_blank(
+    skip_config: dict[str, Any], _module_bus: Mock
+) -> TransformEngine:
+    """TransformEngine built from ``skip_config``."""
+    return TransformEngine(skip_config, _module_bus)
+
+
+@pytest.fixture(scope="module")
+def engine_direct_mapping(
+    direct_mapping_config: dict[str, Any], _module_bus: Mock
+) -> TransformEngine:
+    """TransformEngine built from ``direct_mapping_config``."""
+    return TransformEngine(direct_mapping_config, _module_bus)
+
+
+@pytest.fixture(scope="module")
+def transformer_config() -> dict[str, Any]:
+    """Minimal Transformer config with an empty company schema."""
+    return {"company": {}}
+
+
+@pytest.fixture(scope="module")
+def _transformer_template(
+    transformer_config: dict[str, Any], _module_bus: Mock
+) -> Transformer:
+    """Transformer (and its TransformEngine) built once per module."""
+    return Transformer(transformer_config, _module_bus)
+
+
+@pytest.fixture
+def transformer(_transformer_template: Transformer, mock_bus: Mock) -> Transformer:
+    """Per-test copy of the module Transformer, wired to ``mock_bus``.
+
+    The engine is copied too, so tests can replace ``engine.transform_record``
+    without touching the template; the strategy registry and mapping data are
+    shared read-only.
+    """
+    transformer = copy.copy(_transformer_template)
+    transformer.engine = copy.copy(_transformer_template.engine)
+    transformer.bus = transformer.engine.bus = mock_bus
+    return transformer
+
+
+@pytest.fixture
+def make_change_event() -> Callable[..., SimpleNamespace]:
+    """Factory for change event doubles as returned by ``bus.get_change_event``.
+
+    The event is plain data that nothing asserts calls on, so a namespace is
+    used rather than a Mock.
+    """
+
+    def _make(
+        event: str = "record_added",
+        stage: str = "staged",
+        ocid: str = "ocid:v1:co:test",
+        bid: str = "bid:v1:us_fl:test",
+    ) -> SimpleNamespace:
+        return SimpleNamespace(
+            event=event, stage=stage, sid=SimpleNamespace(ocid=ocid, bid=bid)
+        )
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def company_types_mapping() -> Mapping[str, str]:
+    """Read-only company type lookup shared by the mapping tests."""
+    return MappingProxyType({"LLC": "Limited Liability Company", "CORP": "Corporation"})
+
+
+@pytest.fixture(scope="session")
+def status_mapping() -> Mapping[str, str]:
+    """Read-only status lookup shared by the mapping tests."""
+    return MappingProxyType({"ACT": "Active", "INA": "Inactive"})
+
+
+@pytest.fixture(scope="session")
+def mapping_config_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+    company_types_mapping: Mapping[str, str],
+) -> Path:
+    """Config directory holding the mapping files, written once per session.
+
+    Laid out as ``TransformEngine`` expects under
+    ``OC_DATA_PIPELINE_CONFIG_DIR``: ``transformer/enums/<file>.json``.
+    """
+    config_dir = tmp_path_factory.mktemp("config")
+    enums_dir = config_dir / "transformer" / "enums"
+    enums_dir.mkdir(parents=True)
+    (enums_dir / "company_types.json").write_text(
+        json.dumps(dict(company_types_mapping))
+    )
+    return config_dir
+
+
+# Strategies hold only their config, so one instance serves the whole session
+
+
+@pytest.fixture(scope="session")
+def direct_mapping_strategy() -> DirectMappingStrategy:
+    """Stateless ``oc.direct_mapping`` strategy."""
+    return DirectMappingStrategy(DirectMappingConfig())
+
+
+@pytest.fixture(scope="session")
+def fixed_value_strategy() -> FixedValueStrategy:
+    """``oc.fixed_value`` strategy that always yields ``us_fl``."""
+    return FixedValueStrategy(FixedValueConfig(fixed_value="us_fl"))
+
+
+@pytest.fixture(scope="session")
+def status_lookup_strategy(status_mapping: Mapping[str, str]) -> LookupMappingStrategy:
+    """``oc.lookup_mapping_file`` strategy over ``status_mapping``."""
+    return LookupMappingStrategy(
+        LookupMappingConfig(mapping_file="test.json"), status_mapping
+    )
+
+
+@pytest.fixture(scope="session")
+def parse_date_strategy() -> ParseDateStrategy:
+    """Stateless US-FL date parsing strategy."""
+    return ParseDateStrategy(ParseDateConfig())
+
+
+@pytest.fixture(scope="session")
+def branch_status_strategy() -> DetermineBranchStatusStrategy:
+    """Stateless US-FL branch status strategy."""
+    return DetermineBranchStatusStrategy(DetermineBranchStatusConfig())
@@ -0,0 +1,62 @@
+"""Shared fixtures for data transformer app unit tests."""
+
+import sys
+from collections.abc import Callable
+
+import pytest
+
+from data_transformer_app.health import (
+    HealthCheck,
+    SimpleWSGIRouter,
+    create_health_app,
+)
+
+
+@pytest.fixture(scope="module")
+def passing_health() -> HealthCheck:
+    """HealthCheck whose only check passes."""
+    health_check = HealthCheck("test-app")
+    health_check.add_check("test", lambda: True)
+    return health_check
+
+
+@pytest.fixture(scope="module")
+def failing_health() -> HealthCheck:
+    """HealthCheck whose only check fails."""
+    health_check = HealthCheck("test-app")
+    health_check.add_check("test", lambda: False)
+    return health_check
+
+
+@pytest.fixture(scope="module")
+def router_passing(passing_health: HealthCheck) -> SimpleWSGIRouter:
+    """Router backed by a passing HealthCheck."""
+    return SimpleWSGIRouter(passing_health)
+
+
+@pytest.fixture(scope="module")
+def router_failing(failing_health: HealthCheck) -> SimpleWSGIRouter:
+    """Router backed by a failing HealthCheck."""
+    return SimpleWSGIRouter(failing_health)
+
+
+@pytest.fixture(scope="module")
+def default_app() -> SimpleWSGIRouter:
+    """Health app built with the default application name."""
+    return create_health_app()
+
+
+@pytest.fixture(scope="module")
+def custom_app() -> SimpleWSGIRouter:
+    """Health app built with a custom application name."""
+    return create_health_app("custom-app")
+
+
+@pytest.fixture
+def cli_argv(monkeypatch: pytest.MonkeyPatch) -> Callable[[list[str]], None]:
+    """Setter for ``sys.argv``, restored automatically after the test."""
+
+    def _set(argv: list[str]) -> None:
+        monkeypatch.setattr(sys, "argv", argv)
+
+    return _set
@@ -4,12 +4,14 @@ This module contains unit tests for the command-line interface,
 including argument parsing and command dispatch.
 """
 
-import sys
+from contextlib import nullcontext
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from data_transformer_app.health import SimpleWSGIRouter
 from data_transformer_app.main import (
+    create_health_server,
     generate_run_id,
     health_command,
     main,
@@ -39,35 +41,46 @@ class TestCLI:
         assert "run" in captured.out
         assert "health" in captured.out
 
-    def test_main_with_help(self, capsys) -> None:
+    def test_main_with_help(self, cli_argv, capsys) -> None:
         """Test main function with help command."""
-        with patch.object(sys, "argv", ["main.py", "--help"]):
-            main()
+        cli_argv(["main.py", "--help"])
+        main()
         
         captured = capsys.readouterr()
         assert "OpenCorporates Data transformer" in captured.out
 
-    def test_main_with_version(self, capsys) -> None:
+    def test_main_with_version(self, cli_argv, capsys) -> None:
         """Test main function with version command."""
-        with patch.object(sys, "argv", ["main.py", "--version"]):
-            main()
+        cli_argv(["main.py", "--version"])
+        main()
         
         captured = capsys.readouterr()
         assert "data-transformer-app, version 0.1.0" in captured.out
 
-    def test_main_with_invalid_command(self, capsys) -> None:
-        """Test main function with invalid command."""
-        with patch.object(sys, "argv", ["main.py", "invalid"]):
+    @pytest.mark.parametrize("command", ["run", "health"])
+    def test_main_dispatches_command_with_args(self, cli_argv, command) -> None:
+        """Test main routes a subcommand and its arguments to its handler."""
+        cli_argv(["main.py", command, "--log-level", "DEBUG"])
+        with patch(f"data_transformer_app.main.{command}_command") as mock_handler:
             with pytest.raises(SystemExit) as exc_info:
                 main()
-            assert exc_info.value.code == 1
 
-    def test_main_with_insufficient_args(self, capsys) -> None:
+        mock_handler.assert_called_once_with(["--log-level", "DEBUG"])
+        assert exc_info.value.code == 0
+
+    def test_main_with_invalid_command(self, cli_argv) -> None:
+        """Test main function with invalid command."""
+        cli_argv(["main.py", "invalid"])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 1
+
+    def test_main_with_insufficient_args(self, cli_argv) -> None:
         """Test main function with insufficient arguments."""
-        with patch.object(sys, "argv", ["main.py"]):
-            with pytest.raises(SystemExit) as exc_info:
-                main()
-            assert exc_info.value.code == 1
+        cli_argv(["main.py"])
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 1
 
     @patch("data_transformer_app.main.create_run_config")
     @patch("data_transformer_app.main.configure_logging")
@@ -110,22 +123,30 @@ class TestCLI:
         
         # Mock the server
         mock_server = MagicMock()
-        mock_make_server.return_value.__enter__ = MagicMock(return_value=mock_server)
-        mock_make_server.return_value.__exit__ = MagicMock()
+        mock_make_server.return_value = nullcontext(mock_server)
         
         # Mock KeyboardInterrupt to exit the server loop
         mock_server.serve_forever.side_effect = KeyboardInterrupt()
         
         health_command(["--port", "8080"])
 
-    def test_run_command_missing_data_registry_id(self, capsys) -> None:
+    def test_create_health_server_binds_ephemeral_port(self) -> None:
+        """Test health server creation with an OS-assigned port."""
+        server = create_health_server("127.0.0.1", 0)
+        try:
+            assert server.server_address[1] > 0
+            assert isinstance(server.get_app(), SimpleWSGIRouter)
+        finally:
+            server.server_close()
+
+    def test_run_command_missing_data_registry_id(self) -> None:
         """Test run command with missing data registry ID."""
         with patch.dict("os.environ", {}, clear=True):
             with pytest.raises(SystemExit) as exc_info:
                 run_command([])
             assert exc_info.value.code == 1
 
-    def test_run_command_missing_stage_when_data_registry_id_provided(self, capsys) -> None:
+    def test_run_command_missing_stage_when_data_registry_id_provided(self) -> None:
         """Test run command with data registry ID but missing stage."""
         with patch("data_transformer_app.main.create_run_config") as mock_create_run_config:
             mock_config = MagicMock()
@@ -138,7 +159,7 @@ class TestCLI:
                 run_command(["--data-registry-id", "test_registry"])
             assert exc_info.value.code == 1
 
-    def test_run_command_missing_step_when_data_registry_id_provided(self, capsys) -> None:
+    def test_run_command_missing_step_when_data_registry_id_provided(self) -> None:
         """Test run command with data registry ID and stage but missing step."""
         with patch("data_transformer_app.main.create_run_config") as mock_create_run_config:
             mock_config = MagicMock()
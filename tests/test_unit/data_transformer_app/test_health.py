@@ -5,13 +5,13 @@ and WSGI router functionality.
 """
 
 import json
-from unittest.mock import MagicMock, patch
+import time
+from contextlib import nullcontext
+from unittest.mock import MagicMock
 
-from data_transformer_app.health import (
-    HealthCheck,
-    SimpleWSGIRouter,
-    create_health_app,
-)
+import pytest
+
+from data_transformer_app.health import HealthCheck, SimpleWSGIRouter
 
 
 class TestHealthCheck:
@@ -23,6 +23,7 @@ class TestHealthCheck:
 
         assert health_check.app_name == "test-app"
         assert health_check.start_time > 0
+        assert 0 <= health_check.start_time_ns <= time.monotonic_ns()
         assert len(health_check.checks) == 0
 
     def test_health_check_add_check(self) -> None:
@@ -64,6 +65,20 @@ class TestHealthCheck:
 
         assert health_check.is_healthy() is False
 
+    def test_health_check_is_healthy_short_circuits(self) -> None:
+        """Test that checks after the first failure are not run."""
+        health_check = HealthCheck("test-app")
+        later_check = MagicMock(return_value=True)
+
+        def failing_check() -> bool:
+            return False
+
+        health_check.add_check("first", failing_check)
+        health_check.add_check("second", later_check)
+
+        assert health_check.is_healthy() is False
+        later_check.assert_not_called()
+
     def test_health_check_is_healthy_exception(self) -> None:
         """Test health check when a check raises an exception."""
         health_check = HealthCheck("test-app")
@@ -92,7 +107,7 @@ class TestHealthCheck:
 
         assert status["app_name"] == "test-app"
         assert status["status"] == "unhealthy"  # One check fails
-        assert "uptime_seconds" in status
+        assert status["uptime_seconds"] >= 0
         assert "timestamp" in status
         assert "checks" in status
 
@@ -121,47 +136,40 @@ class TestHealthCheck:
 class TestSimpleWSGIRouter:
     """Test the SimpleWSGIRouter class."""
 
-    def test_router_initialization(self) -> None:
-        """Test router initialization."""
-        health_check = HealthCheck("test-app")
-        router = SimpleWSGIRouter(health_check)
-
-        assert router.health_check == health_check
-        assert "/health" in router.routes
-        assert "/status" in router.routes
-        assert "/heartbeat" in router.routes
+    @pytest.fixture(autouse=True)
+    def _stub_observability(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Replace the logging/observability context managers with no-ops."""
+        monkeypatch.setattr(
+            "data_transformer_app.health.log_bind", lambda *_a, **_k: nullcontext()
+        )
+        monkeypatch.setattr(
+            "data_transformer_app.health.observe_around",
+            lambda *_a, **_k: nullcontext(),
+        )
 
-    def test_router_health_endpoint_success(self) -> None:
+    def test_router_initialization(
+        self, passing_health: HealthCheck, router_passing: SimpleWSGIRouter
+    ) -> None:
+        """Test router initialization."""
+        assert router_passing.health_check == passing_health
+        assert "/health" in router_passing.routes
+        assert "/status" in router_passing.routes
+        assert "/heartbeat" in router_passing.routes
+
+    def test_router_health_endpoint_success(
+        self, router_passing: SimpleWSGIRouter
+    ) -> None:
         """Test health endpoint with successful health check."""
-        health_check = HealthCheck("test-app")
-
-        def passing_check() -> bool:
-            return True
-
-        health_check.add_check("test", passing_check)
-
-        router = SimpleWSGIRouter(health_check)
-
         # Mock WSGI environment
         environ = {"PATH_INFO": "/health", "REQUEST_METHOD": "GET"}
         start_response = MagicMock()
 
-        with (
-            patch("data_transformer_app.health.log_bind") as mock_log_bind,
-            patch("data_transformer_app.health.observe_around") as mock_observe_around,
-        ):
-            # Mock context managers
-            mock_log_bind.return_value.__enter__ = MagicMock()
-            mock_log_bind.return_value.__exit__ = MagicMock()
-            mock_observe_around.return_value.__enter__ = MagicMock()
-            mock_observe_around.return_value.__exit__ = MagicMock()
-
-            response = router(environ, start_response)
+        response = router_passing(environ, start_response)
 
         # Verify response
         response_list = list(response)
         assert len(response_list) == 1
-        response_data = json.loads(response_list[0].decode("utf-8"))
+        response_data = json.loads(response_list[0])
         assert response_data["status"] == "healthy"
 
         # Verify start_response was called with 200 OK
@@ -169,37 +177,20 @@ class TestSimpleWSGIRouter:
             "200 OK", [("Content-Type", "application/json")]
         )
 
-    def test_router_health_endpoint_failure(self) -> None:
+    def test_router_health_endpoint_failure(
+        self, router_failing: SimpleWSGIRouter
+    ) -> None:
         """Test health endpoint with failed health check."""
-        health_check = HealthCheck("test-app")
-
-        def failing_check() -> bool:
-            return False
-
-        health_check.add_check("test", failing_check)
-
-        router = SimpleWSGIRouter(health_check)
-
         # Mock WSGI environment
         environ = {"PATH_INFO": "/health", "REQUEST_METHOD": "GET"}
         start_response = MagicMock()
 
-        with (
-            patch("data_transformer_app.health.log_bind") as mock_log_bind,
-            patch("data_transformer_app.health.observe_around") as mock_observe_around,
-        ):
-            # Mock context managers
-            mock_log_bind.return_value.__enter__ = MagicMock()
-            mock_log_bind.return_value.__exit__ = MagicMock()
-            mock_observe_around.return_value.__enter__ = MagicMock()
-            mock_observe_around.return_value.__exit__ = MagicMock()
-
-            response = router(environ, start_response)
+        response = router_failing(environ, start_response)
 
         # Verify response
         response_list = list(response)
         assert len(response_list) == 1
-        response_data = json.loads(response_list[0].decode("utf-8"))
+        response_data = json.loads(response_list[0])
         assert response_data["status"] == "unhealthy"
 
         # Verify start_response was called with 503 Service Unavailable
@@ -207,69 +198,33 @@ class TestSimpleWSGIRouter:
             "503 Service Unavailable", [("Content-Type", "application/json")]
         )
 
-    def test_router_status_endpoint(self) -> None:
+    def test_router_status_endpoint(self, router_passing: SimpleWSGIRouter) -> None:
         """Test status endpoint."""
-        health_check = HealthCheck("test-app")
-
-        def passing_check() -> bool:
-            return True
-
-        health_check.add_check("test", passing_check)
-
-        router = SimpleWSGIRouter(health_check)
-
         # Mock WSGI environment
         environ = {"PATH_INFO": "/status", "REQUEST_METHOD": "GET"}
         start_response = MagicMock()
 
-        with (
-            patch("data_transformer_app.health.log_bind") as mock_log_bind,
-            patch("data_transformer_app.health.observe_around") as mock_observe_around,
-        ):
-            # Mock context managers
-            mock_log_bind.return_value.__enter__ = MagicMock()
-            mock_log_bind.return_value.__exit__ = MagicMock()
-            mock_observe_around.return_value.__enter__ = MagicMock()
-            mock_observe_around.return_value.__exit__ = MagicMock()
-
-            response = router(environ, start_response)
+        response = router_passing(environ, start_response)
 
         # Verify response
         response_list = list(response)
         assert len(response_list) == 1
-        response_data = json.loads(response_list[0].decode("utf-8"))
+        response_data = json.loads(response_list[0])
         assert response_data["app_name"] == "test-app"
         assert response_data["status"] == "healthy"
         assert "uptime_seconds" in response_data
         assert "timestamp" in response_data
         assert "checks" in response_data
 
-    def test_router_heartbeat_endpoint_success(self) -> None:
+    def test_router_heartbeat_endpoint_success(
+        self, router_passing: SimpleWSGIRouter
+    ) -> None:
         """Test heartbeat endpoint with successful health check."""
-        health_check = HealthCheck("test-app")
-
-        def passing_check() -> bool:
-            return True
-
-        health_check.add_check("test", passing_check)
-
-        router = SimpleWSGIRouter(health_check)
-
         # Mock WSGI environment
         environ = {"PATH_INFO": "/heartbeat", "REQUEST_METHOD": "GET"}
         start_response = MagicMock()
 
-        with (
-            patch("data_transformer_app.health.log_bind") as mock_log_bind,
-            patch("data_transformer_app.health.observe_around") as mock_observe_around,
-        ):
-            # Mock context managers
-            mock_log_bind.return_value.__enter__ = MagicMock()
-            mock_log_bind.return_value.__exit__ = MagicMock()
-            mock_observe_around.return_value.__enter__ = MagicMock()
-            mock_observe_around.return_value.__exit__ = MagicMock()
-
-            response = router(environ, start_response)
+        response = router_passing(environ, start_response)
 
         # Verify response
         response_list = list(response)
@@ -281,32 +236,15 @@ class TestSimpleWSGIRouter:
             "200 OK", [("Content-Type", "text/plain")]
         )
 
-    def test_router_heartbeat_endpoint_failure(self) -> None:
+    def test_router_heartbeat_endpoint_failure(
+        self, router_failing: SimpleWSGIRouter
+    ) -> None:
         """Test heartbeat endpoint with failed health check."""
-        health_check = HealthCheck("test-app")
-
-        def failing_check() -> bool:
-            return False
-
-        health_check.add_check("test", failing_check)
-
-        router = SimpleWSGIRouter(health_check)
-
         # Mock WSGI environment
         environ = {"PATH_INFO": "/heartbeat", "REQUEST_METHOD": "GET"}
         start_response = MagicMock()
 
-        with (
-            patch("data_transformer_app.health.log_bind") as mock_log_bind,
-            patch("data_transformer_app.health.observe_around") as mock_observe_around,
-        ):
-            # Mock context managers
-            mock_log_bind.return_value.__enter__ = MagicMock()
-            mock_log_bind.return_value.__exit__ = MagicMock()
-            mock_observe_around.return_value.__enter__ = MagicMock()
-            mock_observe_around.return_value.__exit__ = MagicMock()
-
-            response = router(environ, start_response)
+        response = router_failing(environ, start_response)
 
         # Verify response
         response_list = list(response)
@@ -318,16 +256,13 @@ class TestSimpleWSGIRouter:
             "503 Service Unavailable", [("Content-Type", "text/plain")]
         )
 
-    def test_router_unsupported_method(self) -> None:
+    def test_router_unsupported_method(self, router_passing: SimpleWSGIRouter) -> None:
         """Test router with unsupported HTTP method."""
-        health_check = HealthCheck("test-app")
-        router = SimpleWSGIRouter(health_check)
-
         # Mock WSGI environment with POST method
         environ = {"PATH_INFO": "/health", "REQUEST_METHOD": "POST"}
         start_response = MagicMock()
 
-        response = router(environ, start_response)
+        response = router_passing(environ, start_response)
 
         # Verify response
         response_list = list(response)
@@ -339,16 +274,13 @@ class TestSimpleWSGIRouter:
             "405 Method Not Allowed", [("Content-Type", "text/plain")]
         )
 
-    def test_router_not_found(self) -> None:
+    def test_router_not_found(self, router_passing: SimpleWSGIRouter) -> None:
         """Test router with unknown path."""
-        health_check = HealthCheck("test-app")
-        router = SimpleWSGIRouter(health_check)
-
         # Mock WSGI environment with unknown path
         environ = {"PATH_INFO": "/unknown", "REQUEST_METHOD": "GET"}
         start_response = MagicMock()
 
-        response = router(environ, start_response)
+        response = router_passing(environ, start_response)
 
         # Verify response
         response_list = list(response)
@@ -364,25 +296,19 @@ class TestSimpleWSGIRouter:
 class TestCreateHealthApp:
     """Test the create_health_app function."""
 
-    def test_create_health_app_default(self) -> None:
+    def test_create_health_app_default(self, default_app: SimpleWSGIRouter) -> None:
         """Test creating health app with default name."""
-        app = create_health_app()
+        assert isinstance(default_app, SimpleWSGIRouter)
+        assert default_app.health_check.app_name == "data-transformer-app"
+        assert "basic" in default_app.health_check.checks
 
-        assert isinstance(app, SimpleWSGIRouter)
-        assert app.health_check.app_name == "data-transformer-app"
-        assert "basic" in app.health_check.checks
-
-    def test_create_health_app_custom_name(self) -> None:
+    def test_create_health_app_custom_name(self, custom_app: SimpleWSGIRouter) -> None:
         """Test creating health app with custom name."""
-        app = create_health_app("custom-app")
-
-        assert isinstance(app, SimpleWSGIRouter)
-        assert app.health_check.app_name == "custom-app"
-        assert "basic" in app.health_check.checks
+        assert isinstance(custom_app, SimpleWSGIRouter)
+        assert custom_app.health_check.app_name == "custom-app"
+        assert "basic" in custom_app.health_check.checks
 
-    def test_create_health_app_basic_check(self) -> None:
+    def test_create_health_app_basic_check(self, default_app: SimpleWSGIRouter) -> None:
         """Test that basic health check is added."""
-        app = create_health_app()
-
         # The basic check should always return True
-        assert app.health_check.checks["basic"]() is True
+        assert default_app.health_check.checks["basic"]() is True
@@ -3,7 +3,13 @@
 This module contains unit tests for the main application functionality.
 """
 
-from data_transformer_app.main import main_async
+from data_transformer_app.main import (
+    health_command,
+    main,
+    main_async,
+    run_command,
+    show_help,
+)
 
 
 class TestMainApplication:
@@ -15,13 +21,6 @@ class TestMainApplication:
 
     def test_cli_import(self) -> None:
         """Test that CLI functions can be imported."""
-        from data_transformer_app.main import (
-            health_command,
-            main,
-            run_command,
-            show_help,
-        )
-
         assert callable(main)
         assert callable(run_command)
         assert callable(health_command)
@@ -14,168 +14,68 @@ from data_transformer_core.core import (
     TransformRunContext,
 )
 
+VALID_BID_STR = "bid:v1:test_registry:20240115103000:abc12345"
+OTHER_BID_STR = "bid:v1:test_registry:20240115103001:def67890"
 
-class TestRequestMeta:
-    """Test RequestMeta structure (dict-based in current implementation)."""
 
-    def test_basic_creation(self) -> None:
-        req = {
-            "url": "https://example.com",
-            "depth": 0,
-            "headers": {},
-            "flags": {},
-            "referer": None,
-        }
-        assert req["url"] == "https://example.com"
-        assert req.get("depth", 0) == 0
-        assert req.get("referer") is None
-        assert req.get("headers") == {}
-        assert req.get("flags") == {}
-
-    def test_with_all_fields(self) -> None:
-        req = {
-            "url": "https://example.com/page",
-            "depth": 2,
-            "referer": "https://example.com",
-            "headers": {"User-Agent": "TestBot"},
-            "flags": {"priority": "high"},
-        }
-        assert req["url"] == "https://example.com/page"
-        assert req["depth"] == 2
-        assert req["referer"] == "https://example.com"
-        assert req["headers"] == {"User-Agent": "TestBot"}
-        assert req["flags"] == {"priority": "high"}
+@pytest.fixture(scope="module")
+def valid_bid() -> BID:
+    """BID parsed once from ``VALID_BID_STR``."""
+    return BID(VALID_BID_STR)
 
 
-class TestResourceMeta:
-    """Test ResourceMeta structure (dict-based)."""
-
-    def test_basic_creation(self) -> None:
-        res = {"url": "https://example.com/resource", "headers": {}}
-        assert res["url"] == "https://example.com/resource"
-        assert res.get("status") is None
-        assert res.get("content_type") is None
-        assert res.get("headers") == {}
-        assert res.get("note") is None
-
-    def test_with_all_fields(self) -> None:
-        res = {
-            "url": "https://example.com/resource",
-            "status": 200,
-            "content_type": "text/html",
-            "headers": {"Content-Length": "1024"},
-            "note": "primary",
-        }
-        assert res["url"] == "https://example.com/resource"
-        assert res["status"] == 200
-        assert res["content_type"] == "text/html"
-        assert res["headers"] == {"Content-Length": "1024"}
-        assert res["note"] == "primary"
+@pytest.fixture(scope="module")
+def other_bid() -> BID:
+    """A second, distinct BID parsed once from ``OTHER_BID_STR``."""
+    return BID(OTHER_BID_STR)
 
 
 class TestBID:
     """Test BID class."""
 
-    def test_basic_creation(self) -> None:
-        """Test basic BID creation (spec-compliant string required)."""
-        val = "bid:v1:test_registry:20240115103000:abc12345"
-        bid = BID(val)
-        assert isinstance(bid, BID)
-        assert str(bid) == val
-
-    def test_custom_value(self) -> None:
-        """Test BID creation with custom value."""
-        custom_value = "bid:v1:test_registry:20240115103000:abc12345"
-        bid = BID(custom_value)
-        assert str(bid) == custom_value
-
-    def test_generate_class_method(self) -> None:
-        """Construct directly with valid string; generation not supported here."""
-        val = "bid:v1:test_registry:20240115103000:abc12345"
-        bid = BID(val)
-        assert isinstance(bid, BID)
-        assert str(bid) == val
-
-    def test_uniqueness(self) -> None:
+    def test_basic_creation(self, valid_bid: BID) -> None:
+        """Test BID creation from a spec-compliant string."""
+        assert isinstance(valid_bid, BID)
+        assert str(valid_bid) == VALID_BID_STR
+
+    def test_uniqueness(self, valid_bid: BID, other_bid: BID) -> None:
         """Test that BIDs are unique."""
-        bid1 = BID("bid:v1:test_registry:20240115103000:abc12345")
-        bid2 = BID("bid:v1:test_registry:20240115103001:def67890")
-        assert bid1 != bid2
-        assert str(bid1) != str(bid2)
+        assert valid_bid != other_bid
+        assert str(valid_bid) != str(other_bid)
 
-    def test_equality(self) -> None:
+    def test_equality(self, valid_bid: BID) -> None:
         """Test BID equality."""
-        value = "bid:v1:test_registry:20240115103000:abc12345"
-        bid1 = BID(value)
-        bid2 = BID(value)
-        assert bid1 == bid2
-        assert str(bid1) == str(bid2)
+        same_bid = BID(VALID_BID_STR)
+        assert valid_bid == same_bid
+        assert str(valid_bid) == str(same_bid)
 
-    def test_inequality_with_different_types(self) -> None:
+    def test_inequality_with_different_types(self, valid_bid: BID) -> None:
         """Test BID inequality with different types."""
-        bid = BID("bid:v1:test_registry:20240115103000:abc12345")
-        assert bid != "bid:v1:test_registry:20240115103000:abc12345"
-        assert bid != 123
-        assert bid is not None
+        assert valid_bid != VALID_BID_STR
+        assert valid_bid != 123
+        assert valid_bid is not None
 
-    def test_hash(self) -> None:
+    def test_hash(self, valid_bid: BID, other_bid: BID) -> None:
         """Test BID hashing."""
-        value = "bid:v1:test_registry:20240115103000:abc12345"
-        bid1 = BID(value)
-        bid2 = BID(value)
-        bid3 = BID("bid:v1:test_registry:20240115103001:def67890")
-
         # Same values should have same hash
-        assert hash(bid1) == hash(bid2)
+        assert hash(valid_bid) == hash(BID(VALID_BID_STR))
 
         # Different values should have different hashes
-        assert hash(bid1) != hash(bid3)
+        assert hash(valid_bid) != hash(other_bid)
 
-    def test_string_representation(self) -> None:
+    def test_string_representation(self, valid_bid: BID) -> None:
         """Test BID string representations."""
-        value = "bid:v1:test_registry:20240115103000:abc12345"
-        bid = BID(value)
-
         # Test __str__
-        assert str(bid) == value
+        assert str(valid_bid) == VALID_BID_STR
 
         # Test __repr__ string contains value
-        repr_str = repr(bid)
-        assert value in repr_str
-
-    def test_value_property(self) -> None:
-        """Test BID string usage as value."""
-        value = "bid:v1:test_registry:20240115103000:abc12345"
-        bid = BID(value)
-        assert str(bid) == value
-
-    def test_spec_compliant_format(self) -> None:
-        """Test that BID validates spec-compliant format."""
-        # Valid spec-compliant BID
-        valid_bid = "bid:v1:test_registry:20240115103000:abc12345"
-        bid = BID(valid_bid)
-        assert str(bid) == valid_bid
-
-        # Spec validation method no longer exists; constructor validation suffices
-
-    def test_invalid_format_rejection(self) -> None:
-        """Test that clearly invalid BID formats are rejected."""
-        with pytest.raises(Exception):
-            BID("invalid-format")
+        assert VALID_BID_STR in repr(valid_bid)
 
-    def test_test_values_allowed(self) -> None:
+    @pytest.mark.parametrize("value", ["invalid-format", "test-bundle-id"])
+    def test_invalid_format_rejection(self, value: str) -> None:
         """Spec-enforced strings must match pattern; invalid ones should raise."""
         with pytest.raises(Exception):
-            BID("test-bundle-id")
-
-    def test_multiple_generations(self) -> None:
-        """Construct multiple BIDs from strings to verify stability."""
-        bid_strings = [
-            "bid:v1:test_registry:20240115103000:abc12345",
-            "bid:v1:test_registry:20240115103001:def67890",
-        ]
-        bids = [BID(s) for s in bid_strings]
-        assert all(isinstance(b, BID) for b in bids)
+            BID(value)
 
 
 class TestBundleRef:
@@ -185,19 +85,18 @@ class TestBundleRef:
         """Test basic BundleRef creation via dict interface."""
         ref = BundleRef.from_dict(
             {
-                "bid": "bid:v1:test_registry:20240115103000:abc12345",
+                "bid": VALID_BID_STR,
                 "meta": {"primary_url": "https://example.com", "resources_count": 5},
             }
         )
         assert ref.meta.get("primary_url") == "https://example.com"
         assert ref.meta.get("resources_count") == 5
 
-    def test_with_all_fields(self) -> None:
+    def test_with_all_fields(self, valid_bid: BID) -> None:
         """Test BundleRef creation with all fields."""
-        custom_bid = BID("bid:v1:test_registry:20240115103000:abc12345")
         ref = BundleRef.from_dict(
             {
-                "bid": str(custom_bid),
+                "bid": str(valid_bid),
                 "meta": {
                     "transformed_at": 1234567890,
                     "primary_url": "https://example.com",
@@ -205,7 +104,7 @@ class TestBundleRef:
                 },
             }
         )
-        assert str(ref.bid) == str(custom_bid)
+        assert str(ref.bid) == str(valid_bid)
         assert ref.meta == {
             "transformed_at": 1234567890,
             "primary_url": "https://example.com",
@@ -214,19 +113,14 @@ class TestBundleRef:
 
     def test_bid_automatic_generation(self) -> None:
         """Test that BID is automatically generated when not provided."""
-        ref1 = BundleRef.from_dict(
-            {"bid": "bid:v1:test_registry:20240115103000:abc12345", "meta": {}}
-        )
-        ref2 = BundleRef.from_dict(
-            {"bid": "bid:v1:test_registry:20240115103001:def67890", "meta": {}}
-        )
+        ref1 = BundleRef.from_dict({"bid": VALID_BID_STR, "meta": {}})
+        ref2 = BundleRef.from_dict({"bid": OTHER_BID_STR, "meta": {}})
         assert ref1.bid != ref2.bid
 
-    def test_bid_custom_value(self) -> None:
+    def test_bid_custom_value(self, valid_bid: BID) -> None:
         """Test BundleRef with custom BID."""
-        custom_bid = BID("bid:v1:test_registry:20240115103000:abc12345")
-        ref = BundleRef.from_dict({"bid": str(custom_bid), "meta": {}})
-        assert str(ref.bid) == "bid:v1:test_registry:20240115103000:abc12345"
+        ref = BundleRef.from_dict({"bid": str(valid_bid), "meta": {}})
+        assert str(ref.bid) == VALID_BID_STR
 
 
 class TestTransformRunContext:
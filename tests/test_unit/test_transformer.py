@@ -1,172 +1,130 @@
 """Unit tests for transformer functionality."""
 
-import json
-import os
-import tempfile
-from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
-from data_transformer_core.transformer import Transformer
 from data_transformer_core.engine import TransformEngine, TransformationResult
-from data_transformer_core.oc_strategies import DirectMappingStrategy, FixedValueStrategy, LookupMappingStrategy
-from data_transformer_core.us_fl_strategies import ParseDateStrategy, DetermineBranchStatusStrategy
-from oc_pipeline_bus.identifiers import SnapshotId
+
+
+# Canned engine results; Transformer only reads them, so they can be shared
+_SUCCESS_RESULT = TransformationResult(
+    success=True, transformed_data={"company_number": "12345", "name": "Test Company"}
+)
+_SKIP_RESULT = TransformationResult(
+    success=True, skipped=True, skip_reason="Field COR_NAME is blank"
+)
 
 
 class TestOCStrategies:
     """Test OpenCorporates universal transformation strategies."""
-    
-    def test_direct_mapping_strategy(self):
+
+    @pytest.mark.parametrize("value", ["test", 123, None])
+    def test_direct_mapping_strategy(self, direct_mapping_strategy, value):
         """Test direct mapping strategy returns value as-is."""
-        from data_transformer_core.oc_strategies import DirectMappingConfig
-        
-        strategy = DirectMappingStrategy(DirectMappingConfig())
-        assert strategy.transform("test") == "test"
-        assert strategy.transform(123) == 123
-        assert strategy.transform(None) is None
-    
-    def test_fixed_value_strategy(self):
+        assert direct_mapping_strategy.transform(value) == value
+
+    def test_fixed_value_strategy(self, fixed_value_strategy):
         """Test fixed value strategy returns the fixed value."""
-        from data_transformer_core.oc_strategies import FixedValueConfig
-        
-        strategy = FixedValueStrategy(FixedValueConfig(fixed_value="us_fl"))
-        assert strategy.transform("anything") == "us_fl"
-    
-    def test_lookup_mapping_strategy(self):
+        assert fixed_value_strategy.transform("anything") == "us_fl"
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("ACT", "Active"),
+            ("INA", "Inactive"),
+            ("UNKNOWN", "UNKNOWN"),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_lookup_mapping_strategy(self, status_lookup_strategy, value, expected):
         """Test lookup mapping strategy."""
-        from data_transformer_core.oc_strategies import LookupMappingConfig
-        
-        mapping_data = {"ACT": "Active", "INA": "Inactive"}
-        strategy = LookupMappingStrategy(LookupMappingConfig(mapping_file="test.json"), mapping_data)
-        
-        assert strategy.transform("ACT") == "Active"
-        assert strategy.transform("INA") == "Inactive"
-        assert strategy.transform("UNKNOWN") == "UNKNOWN"
-        assert strategy.transform("") is None
-        assert strategy.transform(None) is None
+        assert status_lookup_strategy.transform(value) == expected
 
 
 class TestUSFLStrategies:
     """Test US Florida specific transformation strategies."""
-    
-    def test_parse_date_strategy(self):
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("09012025", "2025-09-01"),
+            ("12312024", "2024-12-31"),
+            ("", None),
+            ("invalid", None),
+            ("1234567", None),  # Too short
+        ],
+    )
+    def test_parse_date_strategy(self, parse_date_strategy, value, expected):
         """Test FL date parsing strategy."""
-        from data_transformer_core.us_fl_strategies import ParseDateConfig
-        
-        strategy = ParseDateStrategy(ParseDateConfig())
-        assert strategy.transform("09012025") == "2025-09-01"
-        assert strategy.transform("12312024") == "2024-12-31"
-        assert strategy.transform("") is None
-        assert strategy.transform("invalid") is None
-        assert strategy.transform("1234567") is None  # Too short
-    
-    def test_determine_branch_status_strategy(self):
+        assert parse_date_strategy.transform(value) == expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("FOR", "true"),
+            ("FLL", "true"),
+            ("DOM", "false"),
+            ("LLC", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_determine_branch_status_strategy(
+        self, branch_status_strategy, value, expected
+    ):
         """Test branch status determination strategy."""
-        from data_transformer_core.us_fl_strategies import DetermineBranchStatusConfig
-        
-        strategy = DetermineBranchStatusStrategy(DetermineBranchStatusConfig())
-        assert strategy.transform("FOR") == "true"
-        assert strategy.transform("FLL") == "true"
-        assert strategy.transform("DOM") == "false"
-        assert strategy.transform("LLC") is None
-        assert strategy.transform("") is None
-        assert strategy.transform(None) is None
+        assert branch_status_strategy.transform(value) == expected
 
 
 class TestTransformEngine:
     """Test transform engine class."""
-    
-    def test_skip_record_blank_name(self):
-        """Test that records with blank names are skipped."""
-        config = {
-            "validation_rules": {
-                "skip_conditions": [
-                    {"field": "COR_NAME", "operator": "blank"},
-                    {"field": "COR_NUMBER", "operator": "blank"}
-                ]
-            },
-            "company": {}
-        }
-        
-        bus = Mock()
-        engine = TransformEngine(config, bus)
-        
-        # Test blank name
-        staged_data = {"COR_NAME": "", "COR_NUMBER": "12345"}
-        result = engine.transform_record(SnapshotId("ocid:v1:co:test", "bid:v1:us_fl:test"), staged_data)
-        
-        assert result.success is True
-        assert result.skipped is True
-        assert "COR_NAME" in result.skip_reason
-    
-    def test_skip_record_blank_number(self):
-        """Test that records with blank numbers are skipped."""
-        config = {
-            "validation_rules": {
-                "skip_conditions": [
-                    {"field": "COR_NAME", "operator": "blank"},
-                    {"field": "COR_NUMBER", "operator": "blank"}
-                ]
-            },
-            "company": {}
-        }
-        
-        bus = Mock()
-        engine = TransformEngine(config, bus)
-        
-        # Test blank number
-        staged_data = {"COR_NAME": "Test Company", "COR_NUMBER": ""}
-        result = engine.transform_record(SnapshotId("ocid:v1:co:test", "bid:v1:us_fl:test"), staged_data)
-        
+
+    @pytest.mark.parametrize(
+        ("staged_data", "reason_field"),
+        [
+            ({"COR_NAME": "", "COR_NUMBER": "12345"}, "COR_NAME"),
+            ({"COR_NAME": "Test Company", "COR_NUMBER": ""}, "COR_NUMBER"),
+        ],
+        ids=["blank_name", "blank_number"],
+    )
+    def test_skip_record_blank_field(
+        self, engine_skip_blank, snapshot_id, staged_data, reason_field
+    ):
+        """Test that records with a blank required field are skipped."""
+        result = engine_skip_blank.transform_record(snapshot_id, staged_data)
+
         assert result.success is True
         assert result.skipped is True
-        assert "COR_NUMBER" in result.skip_reason
-    
-    def test_transform_record_success(self):
+        assert reason_field in result.skip_reason
+
+    def test_transform_record_success(self, engine_direct_mapping, snapshot_id):
         """Test successful record transformation."""
-        config = {
-            "validation_rules": {"skip_conditions": []},
-            "company": {
-                "company_number": {
-                    "input_source": "COR_NUMBER",
-                    "transformation_logic": "oc.direct_mapping"
-                },
-                "name": {
-                    "input_source": "COR_NAME", 
-                    "transformation_logic": "oc.direct_mapping"
-                },
-                "jurisdiction_code": {
-                    "transformation_logic": "oc.fixed_value",
-                    "fixed_value": "us_fl"
-                }
-            }
-        }
-        
-        bus = Mock()
-        engine = TransformEngine(config, bus)
-        
-        staged_data = {
-            "COR_NUMBER": "12345",
-            "COR_NAME": "Test Company"
-        }
-        
-        result = engine.transform_record(SnapshotId("ocid:v1:co:test", "bid:v1:us_fl:test"), staged_data)
-        
+        staged_data = {"COR_NUMBER": "12345", "COR_NAME": "Test Company"}
+
+        result = engine_direct_mapping.transform_record(snapshot_id, staged_data)
+
         assert result.success is True
         assert result.skipped is False
         assert result.transformed_data is not None
         assert result.transformed_data["company_number"] == "12345"
         assert result.transformed_data["name"] == "Test Company"
         assert result.transformed_data["jurisdiction_code"] == "us_fl"
-    
-    def test_transform_record_with_mapping_files(self, tmp_path):
+
+    def test_transform_record_with_mapping_files(
+        self,
+        mapping_config_dir,
+        company_types_mapping,
+        monkeypatch,
+        mock_bus,
+        snapshot_id,
+    ):
         """Test transformation with mapping files."""
-        # Create temporary mapping file
-        mapping_file = tmp_path / "company_types.json"
-        mapping_file.write_text('{"LLC": "Limited Liability Company", "CORP": "Corporation"}')
-        
+        # Mapping files are loaded from the config directory when the engine
+        # is built, so it must be in place first
+        monkeypatch.setenv("OC_DATA_PIPELINE_CONFIG_DIR", str(mapping_config_dir))
+
         config = {
             "validation_rules": {"skip_conditions": []},
             "mapping_files": {"company_types": "company_types.json"},
@@ -174,48 +132,36 @@ class TestTransformEngine:
                 "company_type": {
                     "input_source": "COR_FILING_TYPE",
                     "transformation_logic": "oc.lookup_mapping_file",
-                    "mapping_file": "company_types"
+                    "mapping_file": "company_types",
                 }
-            }
+            },
         }
-        
-        bus = Mock()
-        engine = TransformEngine(config, bus)
-        
-        # Mock the config directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            os.environ["OC_DATA_PIPELINE_CONFIG_DIR"] = temp_dir
-            config_dir = Path(temp_dir)
-            (config_dir / "transformer" / "enums").mkdir(parents=True, exist_ok=True)
-            
-            # Copy mapping file to expected location
-            mapping_path = config_dir / "transformer" / "enums" / "company_types.json"
-            mapping_path.write_text('{"LLC": "Limited Liability Company", "CORP": "Corporation"}')
-            
-            staged_data = {"COR_FILING_TYPE": "LLC"}
-            result = engine.transform_record(SnapshotId("ocid:v1:co:test", "bid:v1:us_fl:test"), staged_data)
-            
-            assert result.success is True
-            assert result.transformed_data["company_type"] == "Limited Liability Company"
-    
-    def test_transform_record_error_handling(self):
+
+        engine = TransformEngine(config, mock_bus)
+
+        staged_data = {"COR_FILING_TYPE": "LLC"}
+        result = engine.transform_record(snapshot_id, staged_data)
+
+        assert result.success is True
+        assert result.transformed_data["company_type"] == company_types_mapping["LLC"]
+
+    def test_transform_record_error_handling(self, mock_bus, snapshot_id):
         """Test error handling during transformation."""
         config = {
             "validation_rules": {"skip_conditions": []},
             "company": {
                 "test_field": {
                     "input_source": "TEST_FIELD",
-                    "transformation_logic": "unknown.strategy"
+                    "transformation_logic": "unknown.strategy",
                 }
-            }
+            },
         }
-        
-        bus = Mock()
-        engine = TransformEngine(config, bus)
-        
+
+        engine = TransformEngine(config, mock_bus)
+
         staged_data = {"TEST_FIELD": "test_value"}
-        result = engine.transform_record(SnapshotId("ocid:v1:co:test", "bid:v1:us_fl:test"), staged_data)
-        
+        result = engine.transform_record(snapshot_id, staged_data)
+
         # Should still succeed but with warning logged
         assert result.success is True
         assert result.transformed_data is not None
@@ -225,87 +171,55 @@ class TestTransformEngine:
 
 class TestTransformer:
     """Test transformer service class."""
-    
-    def test_process_record_added_event_success(self):
+
+    def test_process_record_added_event_success(
+        self, transformer, mock_bus, make_change_event
+    ):
         """Test successful processing of record_added event."""
-        config = {"company": {}}
-        bus = Mock()
-        
-        # Mock the change event
-        mock_change_event = Mock()
-        mock_change_event.event = "record_added"
-        mock_change_event.stage = "staged"
-        mock_change_event.sid.ocid = "ocid:v1:co:test"
-        mock_change_event.sid.bid = "bid:v1:us_fl:test"
-        
-        bus.get_change_event.return_value = mock_change_event
-        bus.get_snapshot_json.return_value = {"COR_NUMBER": "12345", "COR_NAME": "Test Company"}
-        bus._utcnow_iso.return_value = "2025-01-01T00:00:00Z"
-        
-        transformer = Transformer(config, bus)
-        
+        mock_bus.get_change_event.return_value = make_change_event()
+        mock_bus.get_snapshot_json.return_value = {
+            "COR_NUMBER": "12345",
+            "COR_NAME": "Test Company",
+        }
+        mock_bus._utcnow_iso.return_value = "2025-01-01T00:00:00Z"
+
         # Mock the engine's transform_record method
-        transformer.engine.transform_record = Mock(return_value=TransformationResult(
-            success=True,
-            transformed_data={"company_number": "12345", "name": "Test Company"}
-        ))
-        
+        transformer.engine.transform_record = Mock(return_value=_SUCCESS_RESULT)
+
         transformer.process_record_added_event("us_fl")
-        
+
         # Verify the bus methods were called
-        bus.get_change_event.assert_called_once()
-        bus.get_snapshot_json.assert_called_once()
-        bus.post_snapshot_json.assert_called_once()
-    
-    def test_process_record_added_event_skipped(self):
+        mock_bus.get_change_event.assert_called_once()
+        mock_bus.get_snapshot_json.assert_called_once()
+        mock_bus.post_snapshot_json.assert_called_once()
+
+    def test_process_record_added_event_skipped(
+        self, transformer, mock_bus, make_change_event
+    ):
         """Test processing of record_added event that gets skipped."""
-        config = {"company": {}}
-        bus = Mock()
-        
-        # Mock the change event
-        mock_change_event = Mock()
-        mock_change_event.event = "record_added"
-        mock_change_event.stage = "staged"
-        mock_change_event.sid.ocid = "ocid:v1:co:test"
-        mock_change_event.sid.bid = "bid:v1:us_fl:test"
-        
-        bus.get_change_event.return_value = mock_change_event
-        bus.get_snapshot_json.return_value = {"COR_NUMBER": "", "COR_NAME": ""}
-        
-        transformer = Transformer(config, bus)
-        
+        mock_bus.get_change_event.return_value = make_change_event()
+        mock_bus.get_snapshot_json.return_value = {"COR_NUMBER": "", "COR_NAME": ""}
+
         # Mock the engine's transform_record method to return skipped
-        transformer.engine.transform_record = Mock(return_value=TransformationResult(
-            success=True,
-            skipped=True,
-            skip_reason="Field COR_NAME is blank"
-        ))
-        
+        transformer.engine.transform_record = Mock(return_value=_SKIP_RESULT)
+
         transformer.process_record_added_event("us_fl")
-        
+
         # Verify the bus methods were called
-        bus.get_change_event.assert_called_once()
-        bus.get_snapshot_json.assert_called_once()
+        mock_bus.get_change_event.assert_called_once()
+        mock_bus.get_snapshot_json.assert_called_once()
         # Should not call post_snapshot_json for skipped records
-        bus.post_snapshot_json.assert_not_called()
-    
-    def test_process_unexpected_event(self):
+        mock_bus.post_snapshot_json.assert_not_called()
+
+    def test_process_unexpected_event(self, transformer, mock_bus, make_change_event):
         """Test processing of unexpected change event."""
-        config = {"company": {}}
-        bus = Mock()
-        
-        # Mock an unexpected change event
-        mock_change_event = Mock()
-        mock_change_event.event = "bundle_ready"
-        mock_change_event.stage = "parsed"
-        
-        bus.get_change_event.return_value = mock_change_event
-        
-        transformer = Transformer(config, bus)
-        
+        mock_bus.get_change_event.return_value = make_change_event(
+            event="bundle_ready", stage="parsed"
+        )
+
         transformer.process_record_added_event("us_fl")
-        
+
         # Verify only get_change_event was called
-        bus.get_change_event.assert_called_once()
-        bus.get_snapshot_json.assert_not_called()
-        bus.post_snapshot_json.assert_not_called()
\ No newline at end of file
+        mock_bus.get_change_event.assert_called_once()
+        mock_bus.get_snapshot_json.assert_not_called()
+        mock_bus.post_snapshot_json.assert_not_called()